@@ -23,13 +23,16 @@ from __future__ import annotations
 
 import gc
 import logging
+import os
+import subprocess
 import sys
-import threading
 import traceback
 from collections.abc import Callable, Iterator
+from contextlib import suppress
 from copy import deepcopy
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import cache
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -37,6 +40,7 @@ from typing import (
     Final,
     Literal,
     NotRequired,
+    TypeAlias,
     TypedDict,
 )
 
@@ -60,13 +64,16 @@ log = logging.getLogger(__name__)
 # =============================================================================
 # CACHE CONFIGURATION
 # =============================================================================
+@cache
 def _setup_cache() -> None:
-    """Configure pycache directory following XDG spec."""
-    import os
-
+    """Configure pycache directory following XDG spec (runs at most once)."""
     try:
         xdg_cache_env = os.environ.get("XDG_CACHE_HOME", "").strip()
-        xdg_cache = Path(xdg_cache_env) if xdg_cache_env else Path.home() / ".cache"
+        if xdg_cache_env:
+            xdg_cache = Path(xdg_cache_env)
+        else:
+            home = Path.home()
+            xdg_cache = home / ".cache"
         cache_dir = xdg_cache / "duskycc"
         cache_dir.mkdir(parents=True, exist_ok=True)
         sys.pycache_prefix = str(cache_dir)
@@ -90,6 +97,7 @@ gi.require_version("Adw", "1")
 from gi.repository import Adw, Gdk, Gio, GLib, Gtk, Pango
 
 import lib.rows as rows
+from lib.rows import RowContext, escape_markup
 
 if TYPE_CHECKING:
     pass
@@ -101,7 +109,14 @@ APP_ID: Final[str] = "com.github.dusky.controlcenter"
 APP_TITLE: Final[str] = "Dusky Control Center"
 CONFIG_FILENAME: Final[str] = "dusky_config.yaml"
 CSS_FILENAME: Final[str] = "dusky_style.css"
+CSS_MANIFEST_FILENAME: Final[str] = "dusky_style.gresource.xml"
+CSS_BUNDLE_FILENAME: Final[str] = "dusky.gresource"
+CSS_RESOURCE_PATH: Final[str] = "/com/github/dusky/controlcenter/style.css"
+CSS_COMPILE_TIMEOUT: Final[int] = 5
 SCRIPT_DIR: Final[Path] = Path(__file__).resolve().parent
+CONFIG_PATH: Final[Path] = SCRIPT_DIR / CONFIG_FILENAME
+CSS_PATH: Final[Path] = SCRIPT_DIR / CSS_FILENAME
+CSS_MANIFEST_PATH: Final[Path] = SCRIPT_DIR / CSS_MANIFEST_FILENAME
 
 # UI Layout Constants
 WINDOW_DEFAULT_WIDTH: Final[int] = 1180
@@ -117,9 +132,12 @@ ERROR_PAGE_ID: Final[str] = "error-state"
 EMPTY_PAGE_ID: Final[str] = "empty-state"
 
 # Behavior
-SEARCH_DEBOUNCE_MS: Final[int] = 200
+SEARCH_CHUNK_SIZE: Final[int] = 200  # Index entries scanned per idle callback
+SEARCH_CHUNKED_MIN_ITEMS: Final[int] = 500  # Smaller indexes are filtered per keystroke
 SEARCH_MAX_RESULTS: Final[int] = 50
+INTERN_MAX_LENGTH: Final[int] = 128
 DEFAULT_TOAST_TIMEOUT: Final[int] = 2
+CONFIG_RELOAD_DEBOUNCE_MS: Final[int] = 300  # Coalesces editor save bursts
 
 # Icons
 ICON_SYSTEM: Final[str] = "emblem-system-symbolic"
@@ -177,6 +195,8 @@ class ItemProperties(TypedDict, total=False):
     placeholder: str
     path: str  # For directory generator
     sort: str  # For directory generator
+    _title_markup: str  # Pre-escaped title, set by _normalize_items
+    _desc_markup: str  # Pre-escaped description, set by _normalize_items
 
 
 class ConfigItem(TypedDict, total=False):
@@ -193,6 +213,10 @@ class ConfigItem(TypedDict, total=False):
     value: dict[str, Any] | None
 
 
+# Flat search index entry: (title_folded, description_folded, breadcrumb, item)
+SearchIndexEntry: TypeAlias = tuple[str, str, str, ConfigItem]
+
+
 class ConfigSection(TypedDict, total=False):
     """A section containing items."""
     type: str
@@ -211,17 +235,7 @@ class ConfigPage(TypedDict):
 class AppConfig(TypedDict):
     """Root configuration object."""
     pages: list[ConfigPage]
-
-
-class RowContext(TypedDict):
-    """Shared context passed to row builders."""
-    stack: Adw.ViewStack | None
-    config: AppConfig
-    sidebar: Gtk.ListBox | None
-    toast_overlay: Adw.ToastOverlay | None
-    nav_view: Adw.NavigationView | None
-    builder_func: Callable[..., Adw.NavigationPage] | None
-    path: list[str]  # Breadcrumb path for navigation depth
+    _page_index: NotRequired[dict[str, int]]  # Page id -> sidebar index, set at load
 
 
 class ConfigLoadResult(TypedDict):
@@ -229,9 +243,84 @@ class ConfigLoadResult(TypedDict):
     success: bool
     config: AppConfig
     css: str
+    css_bundle: Path | None
+    css_mtime_ns: int
     error: str | None
 
 
+# =============================================================================
+# HELPERS
+# =============================================================================
+def _intern_strings(node: dict[str, Any]) -> None:
+    """sys.intern short 'title'/'description' strings of a node in place."""
+    for key in ("title", "description"):
+        value = node.get(key)
+        if isinstance(value, str) and len(value) <= INTERN_MAX_LENGTH:
+            node[key] = sys.intern(value)
+
+
+def _dict_list(value: object) -> list[dict[str, Any]]:
+    """Return the dict entries of a list, or an empty list for non-lists."""
+    if not isinstance(value, list):
+        return []
+    return [entry for entry in value if isinstance(entry, dict)]
+
+
+def _normalize_layout(layout: object) -> list[ConfigSection]:
+    """
+    Validate a layout in a single pass: drop non-dict sections/items, coerce
+    'properties' to dicts and intern titles. Builders and the search index
+    can then trust the structure without re-checking each node.
+    """
+    sections = _dict_list(layout)
+    for section in sections:
+        _intern_strings(section)
+        if "items" in section:
+            section["items"] = _normalize_items(section["items"])
+        if "properties" in section and not isinstance(section["properties"], dict):
+            section["properties"] = {}
+    return sections  # type: ignore[return-value]
+
+
+def _normalize_items(items: object) -> list[ConfigItem]:
+    """Normalize a list of items, recursing into nested layouts and expanders."""
+    entries = _dict_list(items)
+    for item in entries:
+        props = item.get("properties")
+        if not isinstance(props, dict):
+            props = item["properties"] = {}
+        _intern_strings(props)
+        # Escape once here so rows rebuilt on navigation skip the GLib call
+        if "title" in props:
+            props["_title_markup"] = escape_markup(str(props["title"]))
+        if props.get("description"):
+            props["_desc_markup"] = escape_markup(str(props["description"]))
+        if "layout" in item:
+            item["layout"] = _normalize_layout(item["layout"])
+        if "items" in item:
+            item["items"] = _normalize_items(item["items"])
+    return entries  # type: ignore[return-value]
+
+
+# =============================================================================
+# ROW DISPATCH
+# =============================================================================
+# Item type -> (row class, config key holding its action/payload).
+# Built once at import so _build_item_row is a single dict lookup per row.
+_ROW_BUILDERS: Final[dict[str, tuple[Callable[..., Adw.PreferencesRow], str]]] = {
+    ItemType.BUTTON: (rows.ButtonRow, "on_press"),
+    ItemType.TOGGLE: (rows.ToggleRow, "on_toggle"),
+    ItemType.GRID_CARD: (rows.ButtonRow, "on_press"),
+    ItemType.TOGGLE_CARD: (rows.ToggleRow, "on_toggle"),
+    ItemType.LABEL: (rows.LabelRow, "value"),
+    ItemType.SLIDER: (rows.SliderRow, "on_change"),
+    ItemType.SELECTION: (rows.SelectionRow, "on_change"),
+    ItemType.ENTRY: (rows.EntryRow, "on_action"),
+    ItemType.NAVIGATION: (rows.NavigationRow, "layout"),
+    ItemType.EXPANDER: (rows.ExpanderRow, "items"),
+}
+
+
 @dataclass(slots=True)
 class ApplicationState:
     """
@@ -241,8 +330,10 @@ class ApplicationState:
     """
     config: AppConfig = field(default_factory=lambda: {"pages": []})
     css_content: str = ""
+    css_bundle: Path | None = None
+    css_mtime_ns: int = 0
     last_visible_page: str | None = None
-    debounce_source_id: int = 0
+    reload_source_id: int = 0
     config_error: str | None = None
 
 
@@ -265,10 +356,24 @@ class DuskyControlCenter(Adw.Application):
         "_search_btn",
         "_search_page",
         "_search_results_group",
+        "_search_result_rows",
         "_css_provider",
+        "_css_resource",
+        "_config_monitor",
         "_display",
         "_window",
         "_split_view",
+        "_search_index",
+        "_search_static_index",
+        "_search_generators",
+        "_search_index_fresh",
+        "_search_matches",
+        "_search_query",
+        "_search_context",
+        "_search_cancellable",
+        "_pending_pages",
+        "_page_names",
+        "_page_root_tags",
     )
 
     def __init__(self) -> None:
@@ -280,8 +385,25 @@ class DuskyControlCenter(Adw.Application):
         self._state = ApplicationState()
         self._init_widget_refs()
         self._css_provider: Gtk.CssProvider | None = None
+        self._css_resource: Gio.Resource | None = None
+        self._config_monitor: Gio.FileMonitor | None = None
         self._display: Gdk.Display | None = None
         self._window: Adw.Window | None = None
+        self._search_index: list[SearchIndexEntry] = []
+        # Entries that never change for a config load, plus the directory
+        # generators (with their breadcrumbs) re-expanded per search session
+        self._search_static_index: list[SearchIndexEntry] = []
+        self._search_generators: list[tuple[ConfigItem, str]] = []
+        self._search_index_fresh: bool = True
+        self._search_matches: list[SearchIndexEntry] = []
+        self._search_query: str = ""
+        self._search_context: RowContext | None = None
+        self._search_cancellable: Gio.Cancellable | None = None
+        # Page index -> empty NavigationView awaiting its first activation
+        self._pending_pages: dict[int, Adw.NavigationView] = {}
+        # Interned stack names / root tags per page index, built per config load
+        self._page_names: list[str] = []
+        self._page_root_tags: list[str] = []
 
     def _init_widget_refs(self) -> None:
         """Initialize or reset all widget references to None."""
@@ -293,6 +415,7 @@ class DuskyControlCenter(Adw.Application):
         self._search_btn: Gtk.ToggleButton | None = None
         self._search_page: Adw.NavigationPage | None = None
         self._search_results_group: Adw.PreferencesGroup | None = None
+        self._search_result_rows: list[Adw.PreferencesRow] = []
         self._split_view: Adw.OverlaySplitView | None = None
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -316,6 +439,8 @@ class DuskyControlCenter(Adw.Application):
         result = self._load_config_and_css_sync()
         self._state.config = result["config"]
         self._state.css_content = result["css"]
+        self._state.css_bundle = result["css_bundle"]
+        self._state.css_mtime_ns = result["css_mtime_ns"]
         self._state.config_error = result["error"]
 
         self._apply_css()
@@ -329,6 +454,8 @@ class DuskyControlCenter(Adw.Application):
             self._window.realize()
             self._window.set_visible(False)
 
+        self._start_config_monitor()
+
     def do_activate(self) -> None:
         """
         Application entry point.
@@ -339,18 +466,65 @@ class DuskyControlCenter(Adw.Application):
 
     def do_shutdown(self) -> None:
         """Cleanup resources on application exit."""
-        self._cancel_debounce()
+        self._cancel_search()
+        self._stop_config_monitor()
         self._remove_css_provider()
+        self._unregister_css_resource()
         Adw.Application.do_shutdown(self)
 
     # ─────────────────────────────────────────────────────────────────────────
     # RESOURCE MANAGEMENT
     # ─────────────────────────────────────────────────────────────────────────
-    def _cancel_debounce(self) -> None:
-        """Cancel any pending search debounce timer."""
-        if self._state.debounce_source_id > 0:
-            GLib.source_remove(self._state.debounce_source_id)
-            self._state.debounce_source_id = 0
+    def _cancel_search(self) -> None:
+        """Cancel any in-flight chunked search."""
+        if self._search_cancellable is not None:
+            self._search_cancellable.cancel()
+            self._search_cancellable = None
+
+    def _start_config_monitor(self) -> None:
+        """
+        Watch the config file via inotify (Gio.FileMonitor) for automatic hot reload.
+        Ctrl+R remains available as a manual trigger.
+        """
+        try:
+            gfile = Gio.File.new_for_path(str(CONFIG_PATH))
+            monitor = gfile.monitor_file(Gio.FileMonitorFlags.NONE, None)
+        except GLib.Error as e:
+            log.warning("Config file monitor unavailable: %s", e.message)
+            return
+        monitor.connect("changed", self._on_config_file_changed)
+        self._config_monitor = monitor
+
+    def _stop_config_monitor(self) -> None:
+        """Cancel the config file monitor and any pending auto-reload."""
+        if self._state.reload_source_id > 0:
+            GLib.source_remove(self._state.reload_source_id)
+            self._state.reload_source_id = 0
+        if self._config_monitor is not None:
+            self._config_monitor.cancel()
+            self._config_monitor = None
+
+    def _on_config_file_changed(
+        self,
+        _monitor: Gio.FileMonitor,
+        _file: Gio.File,
+        _other_file: Gio.File | None,
+        event_type: Gio.FileMonitorEvent,
+    ) -> None:
+        """Schedule a hot reload once the writer signals it is done."""
+        if event_type != Gio.FileMonitorEvent.CHANGES_DONE_HINT:
+            return
+        if self._state.reload_source_id > 0:
+            GLib.source_remove(self._state.reload_source_id)
+        self._state.reload_source_id = GLib.timeout_add(
+            CONFIG_RELOAD_DEBOUNCE_MS, self._on_config_reload_timeout
+        )
+
+    def _on_config_reload_timeout(self) -> Literal[False]:
+        """Debounced auto-reload callback."""
+        self._state.reload_source_id = 0
+        self._reload_app_async()
+        return GLib.SOURCE_REMOVE
 
     def _remove_css_provider(self) -> None:
         """Remove CSS provider from display to prevent memory leaks."""
@@ -363,6 +537,25 @@ class DuskyControlCenter(Adw.Application):
                 log.debug("CSS provider removal warning: %s", e)
         self._css_provider = None
 
+    def _unregister_css_resource(self) -> None:
+        """Drop the registered stylesheet GResource bundle, if any."""
+        if self._css_resource is not None:
+            with suppress(GLib.Error):
+                self._css_resource._unregister()
+        self._css_resource = None
+
+    def _register_css_resource(self, bundle: Path) -> bool:
+        """Load and register the compiled stylesheet bundle (mmap'd by GIO)."""
+        self._unregister_css_resource()
+        try:
+            resource = Gio.Resource.load(str(bundle))
+            resource._register()
+        except GLib.Error as e:
+            log.warning("Could not register CSS resource %s: %s", bundle, e.message)
+            return False
+        self._css_resource = resource
+        return True
+
     # ─────────────────────────────────────────────────────────────────────────
     # CONFIG I/O
     # ─────────────────────────────────────────────────────────────────────────
@@ -374,12 +567,16 @@ class DuskyControlCenter(Adw.Application):
             ConfigLoadResult with config, css, success status, and any error message.
         """
         config, config_error = self._do_load_config()
-        css = self._do_load_css()
+        css_bundle, css_mtime_ns = self._do_compile_css_bundle()
+        # Raw stylesheet text is only needed when the GResource path is unavailable
+        css = "" if css_bundle is not None else self._do_load_css()
         
         return {
             "success": config_error is None,
             "config": config,
             "css": css,
+            "css_bundle": css_bundle,
+            "css_mtime_ns": css_mtime_ns,
             "error": config_error,
         }
 
@@ -390,7 +587,7 @@ class DuskyControlCenter(Adw.Application):
         Returns:
             Tuple of (config dict, error message or None)
         """
-        config_path = SCRIPT_DIR / CONFIG_FILENAME
+        config_path = CONFIG_PATH
         
         try:
             loaded = utility.load_config(config_path)
@@ -404,12 +601,18 @@ class DuskyControlCenter(Adw.Application):
             if not isinstance(loaded.get("pages"), list):
                 return {"pages": []}, "'pages' must be a list"
             
-            # Validate each page has required 'title'
+            # Single pass: validate each page and normalize its layout tree
+            page_index: dict[str, int] = {}
             for idx, page in enumerate(loaded["pages"]):
                 if not isinstance(page, dict):
                     return {"pages": []}, f"Page {idx} is not a dictionary"
                 if "title" not in page:
                     return {"pages": []}, f"Page {idx} missing required 'title' key"
+                _intern_strings(page)
+                page["layout"] = _normalize_layout(page.get("layout", []))
+                if isinstance(pid := page.get("id"), str):
+                    page_index.setdefault(pid, idx)  # First page wins, as before
+            loaded["_page_index"] = page_index
             
             return loaded, None  # type: ignore[return-value]
             
@@ -426,60 +629,127 @@ class DuskyControlCenter(Adw.Application):
         Returns:
             CSS content string, or empty string on failure.
         """
-        css_path = SCRIPT_DIR / CSS_FILENAME
+        css_path = CSS_PATH
         try:
-            return css_path.read_text(encoding="utf-8")
+            # Single unbuffered read: skips pathlib and TextIOWrapper layers
+            fd = os.open(css_path, os.O_RDONLY | os.O_CLOEXEC)
+            try:
+                return os.read(fd, os.fstat(fd).st_size).decode("utf-8")
+            finally:
+                os.close(fd)
         except FileNotFoundError:
             log.info("No custom CSS file found at: %s", css_path)
             return ""
-        except OSError as e:
+        except (OSError, UnicodeDecodeError) as e:
             log.warning("Failed to read CSS file: %s", e)
             return ""
 
-    def _apply_css(self) -> None:
-        """Apply loaded CSS to the default display."""
-        self._remove_css_provider()
+    def _do_compile_css_bundle(self) -> tuple[Path | None, int]:
+        """
+        Compile the stylesheet into a GResource bundle when it is stale.
 
-        if not self._state.css_content:
-            return
+        Returns:
+            Tuple of (bundle path or None if unavailable, stylesheet mtime in ns).
+        """
+        css_path = CSS_PATH
+        try:
+            css_mtime_ns = css_path.stat().st_mtime_ns
+        except OSError:
+            return None, 0
+
+        bundle = utility.get_cache_dir() / CSS_BUNDLE_FILENAME
+        try:
+            if bundle.stat().st_mtime_ns >= css_mtime_ns:
+                return bundle, css_mtime_ns
+        except OSError:
+            pass
+
+        try:
+            subprocess.run(
+                [
+                    "glib-compile-resources",
+                    f"--sourcedir={SCRIPT_DIR}",
+                    f"--target={bundle}",
+                    str(CSS_MANIFEST_PATH),
+                ],
+                capture_output=True,
+                timeout=CSS_COMPILE_TIMEOUT,
+                check=True,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            log.warning("CSS bundle compile failed, using raw stylesheet: %s", e)
+            return None, css_mtime_ns
+
+        return bundle, css_mtime_ns
+
+    def _ensure_css_provider(self) -> Gtk.CssProvider | None:
+        """Create the CSS provider and attach it to the display once."""
+        if self._css_provider is not None:
+            return self._css_provider
 
         self._display = Gdk.Display.get_default()
         if self._display is None:
             log.warning("No default display available for CSS")
-            return
+            return None
 
         provider = Gtk.CssProvider()
+        Gtk.StyleContext.add_provider_for_display(
+            self._display,
+            provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+        )
+        self._css_provider = provider
+        return provider
+
+    def _apply_css(self) -> None:
+        """
+        Load the stylesheet into the long-lived CSS provider.
+        The provider stays attached to the display; reloads re-parse in place.
+        """
+        bundle = self._state.css_bundle
+        if (
+            bundle is None
+            and not self._state.css_content
+            and self._css_provider is None
+        ):
+            return
+
+        provider = self._ensure_css_provider()
+        if provider is None:
+            return
+
         try:
-            provider.load_from_string(self._state.css_content)
-            Gtk.StyleContext.add_provider_for_display(
-                self._display,
-                provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
-            )
-            # Only store reference after successful add to avoid leak on partial fail
-            self._css_provider = provider
+            if bundle is not None and self._register_css_resource(bundle):
+                provider.load_from_resource(CSS_RESOURCE_PATH)
+            else:
+                if bundle is not None:
+                    # Bundle failed to register; fall back to the raw file
+                    self._state.css_content = self._do_load_css()
+                # An empty string clears rules left over from a deleted stylesheet
+                provider.load_from_string(self._state.css_content)
+            # The provider owns the parsed sheet; don't pin the source text
+            self._state.css_content = ""
         except GLib.Error as e:
             log.error("CSS parsing failed: %s", e.message)
-            # Don't store the failed provider
 
     def _get_context(
         self,
         nav_view: Adw.NavigationView | None = None,
         builder_func: Callable[..., Adw.NavigationPage] | None = None,
-        path: list[str] | None = None,
+        path: tuple[str, ...] = (),
     ) -> RowContext:
         """
-        Construct the shared context dictionary for child widget builders.
+        Construct the shared context for child widget builders.
         """
-        return {
-            "stack": self._stack,
-            "config": self._state.config,
-            "sidebar": self._sidebar_list,
-            "toast_overlay": self._toast_overlay,
-            "nav_view": nav_view,
-            "builder_func": builder_func,
-            "path": path or [],
-        }
+        return RowContext(
+            stack=self._stack,
+            config=self._state.config,
+            sidebar=self._sidebar_list,
+            toast_overlay=self._toast_overlay,
+            nav_view=nav_view,
+            builder_func=builder_func,
+            path=path,
+        )
 
     # ─────────────────────────────────────────────────────────────────────────
     # UI CONSTRUCTION
@@ -593,17 +863,12 @@ class DuskyControlCenter(Adw.Application):
         # Snapshot for rollback on failure
         old_config = deepcopy(self._state.config)
         old_css = self._state.css_content
+        old_css_bundle = self._state.css_bundle
+        old_css_mtime_ns = self._state.css_mtime_ns
 
         def background_load() -> ConfigLoadResult:
             """Execute I/O operations in background thread."""
-            config, error = self._do_load_config()
-            css = self._do_load_css()
-            return {
-                "success": error is None,
-                "config": config,
-                "css": css,
-                "error": error,
-            }
+            return self._load_config_and_css_sync()
 
         def on_complete(
             result: ConfigLoadResult | None, 
@@ -620,13 +885,20 @@ class DuskyControlCenter(Adw.Application):
                 return
 
             try:
+                # Stylesheet is only re-applied when its mtime actually moved
+                css_changed = result["css_mtime_ns"] != old_css_mtime_ns
+
                 # Update state
                 self._state.config = result["config"]
-                self._state.css_content = result["css"]
                 self._state.config_error = result["error"]
+                if css_changed:
+                    self._state.css_content = result["css"]
+                    self._state.css_bundle = result["css_bundle"]
+                    self._state.css_mtime_ns = result["css_mtime_ns"]
 
                 # Rebuild UI
-                self._apply_css()
+                if css_changed:
+                    self._apply_css()
                 self._clear_and_rebuild_ui(current_page)
 
                 if result["error"]:
@@ -639,6 +911,8 @@ class DuskyControlCenter(Adw.Application):
                 # Rollback state
                 self._state.config = old_config
                 self._state.css_content = old_css
+                self._state.css_bundle = old_css_bundle
+                self._state.css_mtime_ns = old_css_mtime_ns
                 self._state.config_error = None
                 self._toast("Reload Failed: UI rebuild error", 3)
 
@@ -657,7 +931,7 @@ class DuskyControlCenter(Adw.Application):
         callback: Callable[[Any, BaseException | None], None],
     ) -> None:
         """
-        Execute a task in a background thread and callback on main thread.
+        Execute a task on the shared worker pool and callback on main thread.
         """
         def wrapper() -> None:
             result: Any = None
@@ -670,8 +944,8 @@ class DuskyControlCenter(Adw.Application):
             
             GLib.idle_add(callback, result, error)
 
-        thread = threading.Thread(target=wrapper, daemon=True, name="reload-worker")
-        thread.start()
+        # Reuse the rows' pooled worker threads rather than spawning one
+        rows.submit_io_task(wrapper)
 
     def _clear_and_rebuild_ui(self, restore_page_index: int | None) -> None:
         """
@@ -680,6 +954,18 @@ class DuskyControlCenter(Adw.Application):
         # Nullify widget references before clearing to avoid GTK warnings
         self._search_page = None
         self._search_results_group = None
+        self._search_result_rows = []
+        self._search_index = []
+        self._search_static_index = []
+        self._search_generators = []
+        self._search_index_fresh = True
+        self._cancel_search()
+        self._search_matches = []
+        self._search_query = ""
+        self._search_context = None
+        self._pending_pages = {}
+        self._page_names = []
+        self._page_root_tags = []
 
         # Clear containers
         self._clear_sidebar()
@@ -696,18 +982,40 @@ class DuskyControlCenter(Adw.Application):
             self._populate_pages(restore_page_index)
 
     def _clear_sidebar(self) -> None:
-        """Remove all rows from the sidebar."""
-        if self._sidebar_list is None:
+        """
+        Remove all rows from the sidebar.
+        Selection handling is blocked so teardown does not emit row-selected per row.
+        """
+        sidebar = self._sidebar_list
+        if sidebar is None:
             return
-        while (row := self._sidebar_list.get_row_at_index(0)) is not None:
-            self._sidebar_list.remove(row)
+        sidebar.handler_block_by_func(self._on_row_selected)
+        try:
+            if hasattr(sidebar, "remove_all"):  # GTK 4.12+
+                sidebar.remove_all()
+            else:
+                for row in self._collect_children(sidebar):
+                    sidebar.remove(row)
+        finally:
+            sidebar.handler_unblock_by_func(self._on_row_selected)
 
     def _clear_stack(self) -> None:
-        """Remove all children from the content stack."""
-        if self._stack is None:
+        """Remove all children from the content stack in a single pass."""
+        stack = self._stack
+        if stack is None:
             return
-        while (child := self._stack.get_first_child()) is not None:
-            self._stack.remove(child)
+        for child in self._collect_children(stack):
+            stack.remove(child)
+
+    @staticmethod
+    def _collect_children(widget: Gtk.Widget) -> list[Gtk.Widget]:
+        """Snapshot a widget's direct children via sibling traversal."""
+        children: list[Gtk.Widget] = []
+        child = widget.get_first_child()
+        while child is not None:
+            children.append(child)
+            child = child.get_next_sibling()
+        return children
 
     # ─────────────────────────────────────────────────────────────────────────
     # SEARCH FUNCTIONALITY
@@ -751,6 +1059,8 @@ class DuskyControlCenter(Adw.Application):
             self._search_btn.set_active(False)
         if self._search_entry:
             self._search_entry.set_text("")
+        # Directories may change before the next search: re-scan them then
+        self._search_index_fresh = not self._search_generators
 
         if self._state.last_visible_page and self._stack:
             self._stack.set_visible_child_name(self._state.last_visible_page)
@@ -763,31 +1073,98 @@ class DuskyControlCenter(Adw.Application):
             self._deactivate_search()
 
     def _on_search_changed(self, entry: Gtk.SearchEntry) -> None:
-        """Handle search text changes with debouncing."""
-        self._cancel_debounce()
+        """
+        Handle search text changes.
+        Small indexes are searched immediately; large ones are scanned in
+        cancellable idle chunks so typing never blocks on the filter.
+        """
+        self._cancel_search()
         query = entry.get_text()
-        src_id = GLib.timeout_add(
-            SEARCH_DEBOUNCE_MS, 
-            self._execute_search, 
-            query
+        if query.strip():
+            self._ensure_search_index()
+
+        # A more specific query can never match when the shorter one found nothing
+        if (
+            self._search_query
+            and not self._search_matches
+            and query.strip().casefold().startswith(self._search_query)
+        ):
+            return
+
+        if len(self._search_index) < SEARCH_CHUNKED_MIN_ITEMS:
+            self._execute_search(query)
+            return
+
+        query = self._prepare_search(query)
+        if not query:
+            return
+
+        cancellable = Gio.Cancellable()
+        self._search_cancellable = cancellable
+        GLib.idle_add(
+            self._run_search_chunk,
+            query,
+            self._search_candidates(query),
+            0,
+            [],
+            cancellable,
         )
-        if src_id > 0:
-            self._state.debounce_source_id = src_id
 
-    def _execute_search(self, query: str) -> Literal[False]:
+    def _on_search_activate(self, entry: Gtk.SearchEntry) -> None:
+        """Run the search immediately on Enter, superseding any chunked scan."""
+        self._cancel_search()
+        self._ensure_search_index()
+        self._execute_search(entry.get_text())
+
+    def _execute_search(self, query: str) -> None:
+        """Execute the search synchronously and populate results."""
+        query = self._prepare_search(query)
+        if query:
+            self._show_search_results(query, list(self._iter_matching_items(query)))
+
+    def _run_search_chunk(
+        self,
+        query: str,
+        candidates: list[SearchIndexEntry],
+        start: int,
+        matches: list[SearchIndexEntry],
+        cancellable: Gio.Cancellable,
+    ) -> Literal[False]:
         """
-        Execute the search and populate results.
-        Returns GLib.SOURCE_REMOVE to prevent repeated execution.
+        Scan one SEARCH_CHUNK_SIZE slice of the candidates, then reschedule
+        for the next slice unless a newer keystroke cancelled this search.
         """
-        self._state.debounce_source_id = 0
+        if cancellable.is_cancelled():
+            return GLib.SOURCE_REMOVE
 
+        end = start + SEARCH_CHUNK_SIZE
+        for entry in candidates[start:end]:
+            if query in entry[0] or (entry[1] and query in entry[1]):
+                matches.append(entry)
+
+        if end < len(candidates):
+            GLib.idle_add(
+                self._run_search_chunk, query, candidates, end, matches, cancellable
+            )
+        else:
+            self._search_cancellable = None
+            self._show_search_results(query, matches)
+        return GLib.SOURCE_REMOVE
+
+    def _prepare_search(self, query: str) -> str:
+        """
+        Normalize the query and switch to the search page.
+        Returns an empty string when there is nothing to search for.
+        """
         if self._stack is None or self._search_results_group is None:
-            return GLib.SOURCE_REMOVE
+            return ""
 
-        query = query.strip().lower()
+        query = query.strip().casefold()
         if not query:
+            self._search_matches = []
+            self._search_query = ""
             self._reset_search_results("Search Results")
-            return GLib.SOURCE_REMOVE
+            return ""
 
         # Save current page before switching to search
         current = self._stack.get_visible_child_name()
@@ -795,39 +1172,64 @@ class DuskyControlCenter(Adw.Application):
             self._state.last_visible_page = current
 
         self._stack.set_visible_child_name(SEARCH_PAGE_ID)
-        self._reset_search_results(f"Results for '{query}'")
-        self._populate_search_results(query)
-
-        return GLib.SOURCE_REMOVE
+        return query
 
-    def _reset_search_results(self, title: str) -> None:
-        """Reset the search results group with a new title."""
-        if self._search_page is None:
+    def _show_search_results(
+        self, query: str, matches: list[SearchIndexEntry]
+    ) -> None:
+        """Render matches, reusing the existing rows when the set is unchanged."""
+        if self._search_results_group is None:
             return
 
-        toolbar = self._search_page.get_child()
-        if not isinstance(toolbar, Adw.ToolbarView):
-            return
+        title = f"Results for '{query}'"
+
+        if self._search_query and self._same_matches(matches, self._search_matches):
+            # Same result set as on screen: keep the existing row widgets
+            self._search_results_group.set_title(title)
+        else:
+            self._reset_search_results(title)
+            self._populate_search_results(matches)
+
+        self._search_matches = matches
+        self._search_query = query
 
-        page = toolbar.get_content()
-        if not isinstance(page, Adw.PreferencesPage):
+    @staticmethod
+    def _same_matches(
+        new: list[SearchIndexEntry], old: list[SearchIndexEntry]
+    ) -> bool:
+        """Check whether two match lists reference the same index entries."""
+        return len(new) == len(old) and all(a is b for a, b in zip(new, old))
+
+    def _reset_search_results(self, title: str) -> None:
+        """
+        Retitle the search results group and remove its rows in place.
+        The group itself is kept alive to avoid page add/remove churn.
+        """
+        group = self._search_results_group
+        if group is None:
             return
 
-        if self._search_results_group is not None:
-            page.remove(self._search_results_group)
+        group.set_title(title)
+        for row in self._search_result_rows:
+            group.remove(row)
+        self._search_result_rows.clear()
 
-        self._search_results_group = Adw.PreferencesGroup(title=title)
-        page.add(self._search_results_group)
+    def _add_search_row(self, row: Adw.PreferencesRow) -> None:
+        """Add a row to the search results group, tracking it for later removal."""
+        if self._search_results_group is None:
+            return
+        self._search_results_group.add(row)
+        self._search_result_rows.append(row)
 
-    def _populate_search_results(self, query: str) -> None:
+    def _populate_search_results(self, matches: list[SearchIndexEntry]) -> None:
         """Populate search results, limited to prevent UI freeze."""
         if self._search_results_group is None:
             return
 
         count = 0
-        context = self._get_context()
+        context = self._search_context or self._get_context()
 
-        for match in self._iter_matching_items(query):
+        for *_, breadcrumb, match in matches:
             if count >= SEARCH_MAX_RESULTS:
                 # Add overflow indicator
                 overflow_row = Adw.ActionRow(
@@ -836,10 +1238,12 @@ class DuskyControlCenter(Adw.Application):
                 )
                 overflow_row.set_activatable(False)
                 overflow_row.add_css_class("dim-label")
-                self._search_results_group.add(overflow_row)
+                self._add_search_row(overflow_row)
                 break
 
-            self._search_results_group.add(self._build_item_row(match, context))
+            self._add_search_row(
+                self._build_item_row(self._with_breadcrumb(match, breadcrumb), context)
+            )
             count += 1
 
         if count == 0:
@@ -848,120 +1252,161 @@ class DuskyControlCenter(Adw.Application):
                 subtitle="Try different search terms",
             )
             no_results.set_activatable(False)
-            self._search_results_group.add(no_results)
+            self._add_search_row(no_results)
+
+    def _search_candidates(self, query: str) -> list[SearchIndexEntry]:
+        """
+        Entries a query must be tested against.
+        When the query only grew more specific, narrow the previous matches
+        instead of rescanning the whole index.
+        """
+        if self._search_query and query.startswith(self._search_query):
+            return self._search_matches
+        return self._search_index
+
+    def _iter_matching_items(self, query: str) -> Iterator[SearchIndexEntry]:
+        """Yield search index entries matching the query."""
+        for entry in self._search_candidates(query):
+            # Empty descriptions are skipped without a substring scan
+            if query in entry[0] or (entry[1] and query in entry[1]):
+                yield entry
+
+    @staticmethod
+    def _with_breadcrumb(item: ConfigItem, breadcrumb: str) -> ConfigItem:
+        """
+        Shallow-copy a matched item, prefixing its description with the breadcrumb.
+        Only 'properties' is rebuilt; row builders never mutate the rest.
+        """
+        props = item.get("properties", {})
+        result: ConfigItem = item.copy()
+        props_copy: ItemProperties = dict(props)  # type: ignore[assignment]
+        original_desc = props.get("description", "")
+        props_copy["description"] = (
+            f"{breadcrumb} • {original_desc}" if original_desc else breadcrumb
+        )
+        # The load-time escape is of the original description
+        props_copy.pop("_desc_markup", None)
+        result["properties"] = props_copy
+        return result
 
-    def _iter_matching_items(self, query: str) -> Iterator[ConfigItem]:
+    def _build_search_index(self) -> None:
         """
-        Iterate through all config items matching the search query.
+        Flatten all searchable config items into a list once per config load.
+        Keystrokes then scan this list instead of re-walking the nested config.
         """
+        index: list[SearchIndexEntry] = []
+        generators: list[tuple[ConfigItem, str]] = []
         for page in self._state.config.get("pages", []):
             page_title = str(page.get("title", "Unknown"))
-            yield from self._recursive_search(
-                page.get("layout", []), 
-                query, 
-                page_title
-            )
-
-    def _recursive_search(
+            self._index_layout(page.get("layout", []), page_title, index, generators)
+        self._search_static_index = index
+        self._search_generators = generators
+        # Directory generators are scanned on the first search, not at startup
+        self._search_index = index
+        self._search_index_fresh = not generators
+        # Search rows share one context per config load (no nav_view/path)
+        self._search_context = self._get_context()
+
+    def _ensure_search_index(self) -> None:
+        """
+        Expand the directory generators into the search index once per
+        search session, so results track the directories' current contents.
+        """
+        if self._search_index_fresh:
+            return
+        self._search_index_fresh = True
+        index = list(self._search_static_index)
+        # Grows while iterating when generated items nest generators of their own
+        pending = list(self._search_generators)
+        for item, breadcrumb in pending:
+            for gen_item in self._process_directory_generator(item):
+                self._index_item(gen_item, breadcrumb, index, pending)
+        self._search_index = index
+        # Narrowing must not reuse matches taken from the previous index
+        self._search_matches = []
+        self._search_query = ""
+
+    def _index_layout(
         self,
         layout: list[ConfigSection],
-        query: str,
         breadcrumb: str,
-    ) -> Iterator[ConfigItem]:
-        """
-        Recursively search through sections and nested layouts.
-        Injects breadcrumb path into the item description for context.
-        """
+        index: list[SearchIndexEntry],
+        generators: list[tuple[ConfigItem, str]],
+    ) -> None:
+        """Recursively index sections and nested layouts."""
         for section in layout:
             for item in section.get("items", []):
-                # Handle generators in search
+                # Generators are deferred to _ensure_search_index
                 if item.get("type") == ItemType.DIRECTORY_GENERATOR:
-                    for gen_item in self._process_directory_generator(item):
-                        yield from self._check_item_match(gen_item, query, breadcrumb)
+                    generators.append((item, breadcrumb))
                 else:
-                    yield from self._check_item_match(item, query, breadcrumb)
+                    self._index_item(item, breadcrumb, index, generators)
 
-    def _check_item_match(
+    def _index_item(
         self,
         item: ConfigItem,
-        query: str,
         breadcrumb: str,
-    ) -> Iterator[ConfigItem]:
-        """Check if a single item matches the query and recurse if needed."""
+        index: list[SearchIndexEntry],
+        generators: list[tuple[ConfigItem, str]],
+    ) -> None:
+        """Index a single item and recurse into its nested layouts/expanders."""
         props = item.get("properties", {})
-        title = str(props.get("title", "")).lower()
-        desc = str(props.get("description", "")).lower()
         item_type = item.get("type", "")
 
-        # Exclude navigation/structure items from direct results unless relevant
+        # Exclude navigation/structure items from direct results
         if item_type not in (ItemType.NAVIGATION, ItemType.EXPANDER):
-            if query in title or query in desc:
-                result: ConfigItem = deepcopy(item)
-                result.setdefault("properties", {})
-                original_desc = props.get("description", "")
-                result["properties"]["description"] = (
-                    f"{breadcrumb} • {original_desc}" 
-                    if original_desc 
-                    else breadcrumb
-                )
-                yield result
+            index.append((
+                str(props.get("title", "")).casefold(),
+                str(props.get("description", "")).casefold(),
+                breadcrumb,
+                item,
+            ))
 
         # Recurse into nested layouts (NavigationRow)
         if "layout" in item:
             sub_title = str(props.get("title", "Submenu"))
-            yield from self._recursive_search(
+            self._index_layout(
                 item.get("layout", []),
-                query,
                 f"{breadcrumb} › {sub_title}",
+                index,
+                generators,
             )
 
         # Recurse into expander items
         if "items" in item and item_type == ItemType.EXPANDER:
             sub_title = str(props.get("title", "Expander"))
-            yield from self._search_expander_items(
+            self._index_expander_items(
                 item.get("items", []),
-                query,
                 f"{breadcrumb} › {sub_title}",
+                index,
             )
 
-    def _search_expander_items(
+    def _index_expander_items(
         self,
         items: list[ConfigItem],
-        query: str,
         breadcrumb: str,
-    ) -> Iterator[ConfigItem]:
-        """
-        Search through expander child items recursively.
-        """
+        index: list[SearchIndexEntry],
+    ) -> None:
+        """Index expander child items recursively."""
         for item in items:
-            if not isinstance(item, dict):
-                continue
-
             props = item.get("properties", {})
-            title = str(props.get("title", "")).lower()
-            desc = str(props.get("description", "")).lower()
             item_type = item.get("type", "")
 
-            # Match against query
             if item_type not in (ItemType.NAVIGATION, ItemType.EXPANDER):
-                if query in title or query in desc:
-                    result: ConfigItem = deepcopy(item)
-                    result.setdefault("properties", {})
-                    original_desc = props.get("description", "")
-                    result["properties"]["description"] = (
-                        f"{breadcrumb} • {original_desc}"
-                        if original_desc
-                        else breadcrumb
-                    )
-                    yield result
+                index.append((
+                    str(props.get("title", "")).casefold(),
+                    str(props.get("description", "")).casefold(),
+                    breadcrumb,
+                    item,
+                ))
 
             # Recurse into nested expanders
             if "items" in item and item_type == ItemType.EXPANDER:
                 sub_title = str(props.get("title", "Expander"))
-                yield from self._search_expander_items(
+                self._index_expander_items(
                     item.get("items", []),
-                    query,
                     f"{breadcrumb} › {sub_title}",
+                    index,
                 )
 
     # ─────────────────────────────────────────────────────────────────────────
@@ -997,6 +1442,7 @@ class DuskyControlCenter(Adw.Application):
         self._search_bar = Gtk.SearchBar()
         self._search_entry = Gtk.SearchEntry(placeholder_text="Find setting...")
         self._search_entry.connect("search-changed", self._on_search_changed)
+        self._search_entry.connect("activate", self._on_search_activate)
         self._search_bar.set_child(self._search_entry)
         self._search_bar.connect_entry(self._search_entry)
         view.add_top_bar(self._search_bar)
@@ -1030,11 +1476,13 @@ class DuskyControlCenter(Adw.Application):
             return
 
         idx = row.get_index()
-        pages = self._state.config.get("pages", [])
-        if 0 <= idx < len(pages):
-            page_name = f"{PAGE_PREFIX}{idx}"
-            root_tag = f"root_{idx}"
-            self._switch_to_page_and_reset(page_name, root_tag)
+        if 0 <= idx < len(self._page_names):
+            # Deferred page: build its content on first activation
+            if (nav := self._pending_pages.pop(idx, None)) is not None:
+                self._build_page_root(idx, nav)
+            self._switch_to_page_and_reset(
+                self._page_names[idx], self._page_root_tags[idx]
+            )
 
     def _on_row_activated(self, listbox: Gtk.ListBox, row: Gtk.ListBoxRow) -> None:
         """Handle sidebar row activation (clicking already selected row)."""
@@ -1063,45 +1511,85 @@ class DuskyControlCenter(Adw.Application):
             self._show_empty_state()
             return
 
+        self._build_search_index()
+        self._page_names = [sys.intern(f"{PAGE_PREFIX}{i}") for i in range(len(pages))]
+        self._page_root_tags = [sys.intern(f"root_{i}") for i in range(len(pages))]
+
         first_row: Gtk.ListBoxRow | None = None
         target_row: Gtk.ListBoxRow | None = None
 
+        # Only the initially visible page is built eagerly; the rest are
+        # filled in by _on_row_selected the first time they are shown.
+        eager_index = (
+            select_index
+            if select_index is not None and 0 <= select_index < len(pages)
+            else 0
+        )
+
+        # Build everything detached first, then attach in one pass below
+        built: list[tuple[Gtk.ListBoxRow, Adw.NavigationView]] = []
+
         for idx, page in enumerate(pages):
             title = str(page.get("title", "Untitled"))
             icon = str(page.get("icon", ICON_DEFAULT))
-            root_tag = f"root_{idx}"
 
             # Create sidebar row
             row = self._create_sidebar_row(title, icon)
-            
-            if self._sidebar_list:
-                self._sidebar_list.append(row)
-                if first_row is None:
-                    first_row = row
-                if idx == select_index:
-                    target_row = row
-
-            # Create content page
+            if first_row is None:
+                first_row = row
+            if idx == select_index:
+                target_row = row
+
+            # Create content page container
             nav = Adw.NavigationView()
-            
-            ctx = self._get_context(
-                nav_view=nav, 
-                builder_func=self._build_nav_page,
-                path=[title]
-            )
-            
-            # Pass root_tag to ensure we can pop back to this specific page
-            root = self._build_nav_page(title, page.get("layout", []), ctx, root_tag=root_tag)
-            nav.add(root)
+            if idx == eager_index:
+                self._build_page_root(idx, nav)
+            else:
+                self._pending_pages[idx] = nav
+            built.append((row, nav))
+
+        # Hide + freeze containers so N insertions cost one relayout
+        sidebar = self._sidebar_list
+        stack = self._stack
+        if sidebar:
+            sidebar.set_visible(False)
+            sidebar.freeze_notify()
+        if stack:
+            stack.freeze_notify()
 
-            if self._stack:
-                self._stack.add_named(nav, f"{PAGE_PREFIX}{idx}")
+        try:
+            for idx, (row, nav) in enumerate(built):
+                if sidebar:
+                    sidebar.append(row)
+                if stack:
+                    stack.add_named(nav, self._page_names[idx])
+        finally:
+            if stack:
+                stack.thaw_notify()
+            if sidebar:
+                sidebar.thaw_notify()
+                sidebar.set_visible(True)
 
         # Select appropriate row
-        if self._sidebar_list:
+        if sidebar:
             row_to_select = target_row or first_row
             if row_to_select:
-                self._sidebar_list.select_row(row_to_select)
+                sidebar.select_row(row_to_select)
+
+    def _build_page_root(self, idx: int, nav: Adw.NavigationView) -> None:
+        """Build the root navigation page for config page *idx* into *nav*."""
+        page = self._state.config.get("pages", [])[idx]
+        title = str(page.get("title", "Untitled"))
+
+        ctx = self._get_context(
+            nav_view=nav,
+            builder_func=self._build_nav_page,
+            path=(title,)
+        )
+
+        # Pass root_tag to ensure we can pop back to this specific page
+        root = self._build_nav_page(title, page.get("layout", []), ctx, root_tag=self._page_root_tags[idx])
+        nav.add(root)
 
     def _create_sidebar_row(self, title: str, icon_name: str) -> Gtk.ListBoxRow:
         """Create a styled sidebar navigation row."""
@@ -1137,7 +1625,7 @@ class DuskyControlCenter(Adw.Application):
         Build a navigation page with toolbar and preferences content.
         """
         # Determine Path and Tag
-        path = ctx.get("path", [title])
+        path = ctx.path or (title,)
         tag = root_tag if root_tag else f"page_{len(path)}_{title.replace(' ', '_')}"
         
         page = Adw.NavigationPage(title=title, tag=tag)
@@ -1204,7 +1692,7 @@ class DuskyControlCenter(Adw.Application):
         props = section.get("properties", {})
 
         if title := props.get("title"):
-            group.set_title(GLib.markup_escape_text(str(title)))
+            group.set_title(escape_markup(str(title)))
 
         flow = Gtk.FlowBox()
         flow.set_valign(Gtk.Align.START)
@@ -1238,9 +1726,9 @@ class DuskyControlCenter(Adw.Application):
         props = section.get("properties", {})
 
         if title := props.get("title"):
-            group.set_title(GLib.markup_escape_text(str(title)))
+            group.set_title(escape_markup(str(title)))
         if desc := props.get("description"):
-            group.set_description(GLib.markup_escape_text(str(desc)))
+            group.set_description(escape_markup(str(desc)))
 
         for item in section.get("items", []):
             if item.get("type") == ItemType.DIRECTORY_GENERATOR:
@@ -1303,32 +1791,16 @@ class DuskyControlCenter(Adw.Application):
         props = item.get("properties", {})
 
         try:
-            match item_type:
-                case ItemType.BUTTON:
-                    return rows.ButtonRow(props, item.get("on_press"), ctx)
-                case ItemType.TOGGLE:
-                    return rows.ToggleRow(props, item.get("on_toggle"), ctx)
-                case ItemType.GRID_CARD:
-                    return rows.ButtonRow(props, item.get("on_press"), ctx)
-                case ItemType.TOGGLE_CARD:
-                    return rows.ToggleRow(props, item.get("on_toggle"), ctx)
-                case ItemType.LABEL:
-                    return rows.LabelRow(props, item.get("value"), ctx)
-                case ItemType.SLIDER:
-                    return rows.SliderRow(props, item.get("on_change"), ctx)
-                case ItemType.SELECTION:
-                    return rows.SelectionRow(props, item.get("on_change"), ctx)
-                case ItemType.ENTRY:
-                    return rows.EntryRow(props, item.get("on_action"), ctx)
-                case ItemType.NAVIGATION:
-                    return rows.NavigationRow(props, item.get("layout"), ctx)
-                case ItemType.EXPANDER:
-                    return rows.ExpanderRow(props, item.get("items"), ctx)
-                case ItemType.WARNING_BANNER:
-                    return self._build_warning_banner(props)
-                case _:
-                    log.warning("Unknown item type '%s', defaulting to button", item_type)
-                    return rows.ButtonRow(props, item.get("on_press"), ctx)
+            if item_type == ItemType.WARNING_BANNER:
+                return self._build_warning_banner(props)
+
+            builder = _ROW_BUILDERS.get(item_type)
+            if builder is None:
+                log.warning("Unknown item type '%s', defaulting to button", item_type)
+                builder = _ROW_BUILDERS[ItemType.BUTTON]
+
+            row_cls, action_key = builder
+            return row_cls(props, item.get(action_key), ctx)
         except Exception as e:
             log.error("Failed to build row for type '%s': %s", item_type, e)
             # Return error placeholder row
@@ -1350,13 +1822,13 @@ class DuskyControlCenter(Adw.Application):
         icon.add_css_class("warning-banner-icon")
 
         title = Gtk.Label(
-            label=GLib.markup_escape_text(str(props.get("title", "Warning"))),
+            label=escape_markup(str(props.get("title", "Warning"))),
             css_classes=["title-1"],
         )
         title.set_halign(Gtk.Align.CENTER)
 
         message = Gtk.Label(
-            label=GLib.markup_escape_text(str(props.get("message", ""))),
+            label=escape_markup(str(props.get("message", ""))),
             css_classes=["body"],
         )
         message.set_halign(Gtk.Align.CENTER)
@@ -4,7 +4,7 @@ Row widget definitions for the Dusky Control Center.
 Optimized for:
 - Stability: Thread Guards and cancellation tracking prevent race conditions.
 - Efficiency: Gio.Subprocess async I/O eliminates thread pool overhead for shell commands.
-- Type Safety: Strict TypedDict definitions and runtime-checkable Protocols.
+- Type Safety: Strict TypedDict definitions and structural Protocols.
 - Architecture: Unified AsyncPollingMixin eliminates boilerplate and ensures consistent lifecycle management.
 - Performance: Native Linux inotify (Gio.FileMonitor) eliminates idle polling for state files.
 
@@ -13,25 +13,29 @@ GTK4/Libadwaita compatible with proper lifecycle management via `do_unroot`.
 from __future__ import annotations
 
 import atexit
+import itertools
 import logging
 import math
+import os
 import shlex
-import subprocess
+import shutil
+import signal
 import threading
+import weakref
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass, field
-from functools import lru_cache
+from dataclasses import dataclass, field, replace
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Final,
+    Literal,
     NotRequired,
     Protocol,
     TypeAlias,
     TypedDict,
-    runtime_checkable,
 )
 from contextlib import suppress, contextmanager
 
@@ -56,15 +60,23 @@ log = logging.getLogger(__name__)
 DEFAULT_ICON: Final[str] = "utilities-terminal-symbolic"
 DEFAULT_INTERVAL_SECONDS: Final[int] = 5
 MONITOR_INTERVAL_SECONDS: Final[int] = 2
+# Floor for state/icon monitors: nobody perceives a toggle or icon flipping
+# faster, and whole-second timers let GLib batch wakeups across the session.
+MIN_MONITOR_INTERVAL_SECONDS: Final[int] = 2
 MIN_STEP_VALUE: Final[float] = 1e-9
 SLIDER_DEBOUNCE_MS: Final[int] = 150
 SUBPROCESS_TIMEOUT_SHORT: Final[int] = 2
 SUBPROCESS_TIMEOUT_LONG: Final[int] = 5
 ICON_PIXEL_SIZE: Final[int] = 28
 LABEL_MAX_WIDTH_CHARS: Final[int] = 16
+# Option-list diffs wider than this rebuild the model instead of splicing
+OPTIONS_SPLICE_MAX: Final[int] = 4
+LABEL_READ_MAX_BYTES: Final[int] = 4096
+BADGE_READ_MAX_BYTES: Final[int] = 16
 
-# Bumped to 12 to prevent thread starvation on map storms
-EXECUTOR_MAX_WORKERS: Final[int] = 12
+# The pool only serves blocking file I/O (settings, sysfs/procfs reads);
+# shell commands run through Gio.Subprocess, so two workers suffice.
+EXECUTOR_MAX_WORKERS: Final[int] = 2
 
 LABEL_PLACEHOLDER: Final[str] = "..."
 LABEL_NA: Final[str] = "N/A"
@@ -76,10 +88,73 @@ STATE_OFF: Final[str] = "Off"
 TRUE_VALUES: Final[frozenset[str]] = frozenset(
     {"enabled", "yes", "true", "1", "on", "active", "set", "running", "open", "high"}
 )
+# lower/UPPER/Capitalized spellings so polled output matches without .lower()
+_TRUE_VALUES_ALLCASE: Final[frozenset[str]] = frozenset(
+    v for s in TRUE_VALUES for v in (s, s.upper(), s.capitalize())
+)
 
-# Shell metacharacters that mandate /bin/sh -c interpretation.
+# ButtonRow "style" value -> CSS class; anything else is "default-action"
+_BUTTON_STYLE_CLASSES: Final[dict[str, str]] = {
+    "destructive": "destructive-action",
+    "suggested": "suggested-action",
+}
+
+# Hot GLib entry points bound once; teardown and result hand-off call these
+# per widget, so skip the module attribute lookup each time.
+_glib_source_remove: Final[Callable[[int], bool]] = GLib.source_remove
+_glib_find_source: Final[Callable[[int], GLib.Source | None]] = (
+    GLib.MainContext.default().find_source_by_id
+)
+_glib_idle_add: Final[Callable[..., int]] = GLib.idle_add
+
+# A poll loop whose widget stays unmapped this long drops its bus
+# subscription entirely; "map" re-subscribes it and polls at once.
+POLL_PARK_AFTER_US: Final[int] = 30_000_000
+
+# Poll output shared between loops running the same argv (e.g. several
+# cards asking "is bluetooth on"). Loops are phased by hash(argv), so
+# identical commands land on the same bus tick: the first spawns, the rest
+# wait on its result, and anything asking within the TTL reuses it.
+# Distinct commands still spread across their interval.
+# Main-thread only: filled from GIO callbacks, read from bus ticks.
+POLL_CACHE_TTL_US: Final[int] = 1_000_000
+_poll_cache: Final[dict[tuple[str, ...], tuple[int, str]]] = {}
+_poll_waiters: Final[dict[tuple[str, ...], list[Callable[[str | None], None]]]] = {}
+
+
+def _cached_poll_output(argv: tuple[str, ...]) -> str | None:
+    """Output of *argv* if some widget ran it within POLL_CACHE_TTL_US."""
+    if (cached := _poll_cache.get(argv)) is not None:
+        stamp, output = cached
+        if GLib.get_monotonic_time() - stamp < POLL_CACHE_TTL_US:
+            return output
+    return None
+
+
+def _publish_poll_output(
+    argv: tuple[str, ...],
+    waiters: list[Callable[[str | None], None]],
+    output: str | None,
+) -> None:
+    """Finish a shared run: retire its waiter list, cache and fan out *output*."""
+    if _poll_waiters.get(argv) is waiters:
+        del _poll_waiters[argv]
+    if output is not None:
+        _poll_cache[argv] = (GLib.get_monotonic_time(), output)
+    for deliver in waiters:
+        deliver(output)
+
+# Pseudo filesystems never emit inotify events; `cat` of these is still
+# polled, but as an async read rather than a fork+exec.
+_PSEUDO_FS_PREFIXES: Final[tuple[str, ...]] = ("/sys/", "/proc/", "/dev/")
+_CAT_BINARIES: Final[frozenset[str]] = frozenset({"cat", "/bin/cat", "/usr/bin/cat"})
+
+# Shell metacharacters that mandate /bin/sh -c interpretation, as a
+# str.translate deletion table (a C-level scan instead of per-char hashing).
 # Quotes (' ") are intentionally excluded: shlex.split() handles them.
-_SHELL_METACHAR: Final[frozenset[str]] = frozenset('|&;<>()$`\\*?#~![]{}=\n')
+_SHELL_METACHAR_TABLE: Final[dict[int, None]] = str.maketrans(
+    "", "", '|&;<>()$`\\*?#~![]{}=\n'
+)
 
 
 # =============================================================================
@@ -111,7 +186,10 @@ class _ExecutorManager:
                 if self._executor is None or self._is_shutdown:
                     self._is_shutdown = False
                     self._executor = ThreadPoolExecutor(
-                        max_workers=EXECUTOR_MAX_WORKERS,
+                        max_workers=min(
+                            EXECUTOR_MAX_WORKERS,
+                            os.cpu_count() or EXECUTOR_MAX_WORKERS,
+                        ),
                         thread_name_prefix="dusky-io-",
                     )
         return self._executor
@@ -126,9 +204,16 @@ class _ExecutorManager:
                 self._executor = None
 
 
-def _get_executor() -> ThreadPoolExecutor:
-    """Module-level accessor for the singleton executor."""
-    return _ExecutorManager().get()
+# Bound once: submits skip the singleton __new__ dance on every tick
+_get_executor: Final[Callable[[], ThreadPoolExecutor]] = _ExecutorManager().get
+
+
+def submit_io_task(func: Callable[[], None]) -> None:
+    """
+    Run *func* on the shared I/O pool (also used by the main window for
+    config reloads). Raises RuntimeError once the pool has shut down.
+    """
+    _get_executor().submit(func)
 
 
 # =============================================================================
@@ -153,6 +238,26 @@ class IconConfigStatic(TypedDict):
 IconConfig: TypeAlias = str | IconConfigExec | IconConfigFile | IconConfigStatic
 
 
+@dataclass(slots=True, frozen=True)
+class _ParsedIconConfig:
+    """IconConfig normalized once per widget; consumers branch on attributes."""
+    kind: Literal["static", "file", "exec"] = "static"
+    name: str = DEFAULT_ICON
+    path: str = ""
+    command: str = ""
+    interval: int = 0
+
+
+@dataclass(slots=True, frozen=True)
+class _CommandTemplate:
+    """An action command pre-split on ``{value}``; filling it is one join."""
+    parts: tuple[str, ...]
+    terminal: bool = False
+
+    def fill(self, value: str) -> str:
+        return value.join(self.parts)
+
+
 class ActionExec(TypedDict, total=False):
     type: str  # Literal["exec"]
     command: str
@@ -175,6 +280,7 @@ ActionConfig: TypeAlias = ActionExec | ActionRedirect | ActionToggle | dict[str,
 class ValueConfigExec(TypedDict):
     type: str  # Literal["exec"]
     command: str
+    stream: NotRequired[bool]  # Long-running command; one line per update
 
 
 class ValueConfigStatic(TypedDict):
@@ -210,6 +316,7 @@ class RowProperties(TypedDict, total=False):
     key: str
     state_command: str
     value_command: str
+    value_file: str
     min: float
     max: float
     step: float
@@ -221,16 +328,28 @@ class RowProperties(TypedDict, total=False):
     placeholder: str
     badge_file: str
     buttons: list[dict[str, Any]]
+    # Pre-escaped at config load by the controller; absent for runtime rows
+    _title_markup: str
+    _desc_markup: str
 
 
-class RowContext(TypedDict, total=False):
-    stack: Adw.ViewStack | None
-    config: dict[str, object]
-    sidebar: Gtk.ListBox | None
-    toast_overlay: Adw.ToastOverlay | None
-    nav_view: Adw.NavigationView | None
-    builder_func: Callable[..., Adw.NavigationPage] | None
-    path: NotRequired[list[str]]
+@dataclass(slots=True, frozen=True)
+class RowContext:
+    """
+    Immutable context shared by row builders.
+    Slotted attribute access replaces per-row dict lookups; derive variants via
+    dataclasses.replace() instead of copying.
+    """
+    stack: Adw.ViewStack | None = None
+    config: Mapping[str, object] = field(default_factory=dict)
+    sidebar: Gtk.ListBox | None = None
+    toast_overlay: Adw.ToastOverlay | None = None
+    nav_view: Adw.NavigationView | None = None
+    builder_func: Callable[..., Adw.NavigationPage] | None = None
+    path: tuple[str, ...] = ()
+
+
+_EMPTY_CONTEXT: Final[RowContext] = RowContext()
 
 
 # =============================================================================
@@ -240,11 +359,37 @@ class RowContext(TypedDict, total=False):
 class PollSlot:
     """
     Atomic state for one polling channel.
-    Encapsulates the lifecycle of a single repeating task (source ID, cancellable, running state).
+    Encapsulates the lifecycle of a single repeating task (bus subscription, cancellable, running state).
+    Invariant: slots driven by AsyncPollingMixin are only written on the main
+    thread; executor workers hand results back through GLib.idle_add.
     """
-    source_id: int = 0
     cancellable: Any = None
     is_running: bool = False
+    pending_idle: bool = False  # An idle UI flush is already queued
+    argv: tuple[str, ...] | None = None  # Pre-split polled command
+    # Reused across ticks via reset(); runs are matched by token, not identity
+    persistent_cancellable: Gio.Cancellable | None = None
+    token: int = 0
+    read_path: str | None = None  # Set when the command is a plain `cat <path>`
+    watch: Gio.FileMonitor | None = None  # Replaces the timer for regular files
+    bus_token: int = 0  # _POLL_BUS subscription driving this slot's poll loop
+    # (interval, on_output, timeout, fast) kept to re-subscribe a parked loop
+    bus_args: tuple[int, Callable[[str], None], int, bool] | None = None
+    unmapped_since: int = 0  # Monotonic µs of the first unmapped bus tick
+    # Plain periodic tick on _POLL_BUS, re-armed on "map" (see _start_mapped_timer)
+    timer_token: int = 0
+    interval: int = 0
+    tick: Callable[[], bool] | None = None
+
+
+_POLL_SLOT_NAMES: Final[frozenset[str]] = frozenset({"icon", "monitor", "value", "misc"})
+# One lock for every widget's state. Sections are a few attribute writes,
+# destroyed checks are lock-free, and nearly all holders are the main
+# thread, so a lock per widget bought no parallelism. Reentrant so a
+# holder can never deadlock on a second widget's (shared) lock.
+_WIDGET_STATE_LOCK: Final[threading.RLock] = threading.RLock()
+# Separate from WidgetState.lock, which callers often hold on first touch
+_poll_slot_create_lock: Final[threading.Lock] = threading.Lock()
 
 
 @dataclass(slots=True)
@@ -252,61 +397,80 @@ class WidgetState:
     """
     Thread-safe state container for widget lifecycle and async operation guards.
     Uses dedicated slots for different polling concerns to prevent state collisions.
+    All instances share _WIDGET_STATE_LOCK.
     """
 
-    lock: threading.Lock = field(default_factory=threading.Lock)
+    lock: threading.RLock = field(default=_WIDGET_STATE_LOCK, repr=False, compare=False)
+    # Written only by mark_destroyed() under the lock; pure checks read it
+    # lock-free, since a bool attribute load is atomic under the GIL
     is_destroyed: bool = False
     
-    # Dedicated slots for concurrent polling operations
-    icon: PollSlot = field(default_factory=PollSlot)     # For DynamicIconMixin
-    monitor: PollSlot = field(default_factory=PollSlot)  # For StateMonitorMixin (toggles)
-    value: PollSlot = field(default_factory=PollSlot)    # For SliderMonitorMixin/LabelRow
-    misc: PollSlot = field(default_factory=PollSlot)     # For generic extras (Badge, Button Text)
+    # Dedicated slots for concurrent polling operations. Left unset until
+    # first touched (see __getattr__): most widgets use one or two of them
+    icon: PollSlot = field(init=False, repr=False, compare=False)     # For DynamicIconMixin
+    monitor: PollSlot = field(init=False, repr=False, compare=False)  # For StateMonitorMixin (toggles)
+    value: PollSlot = field(init=False, repr=False, compare=False)    # For SliderMonitorMixin/LabelRow
+    misc: PollSlot = field(init=False, repr=False, compare=False)     # For generic extras (Badge, Button Text)
     
-    # Specific ID for slider debounce (separate from generic polling)
+    # Specific ID for slider debounce (separate from generic polling);
+    # main-thread only, so SliderRow swaps it without taking the lock
     debounce_source_id: int = 0
 
-    @property
-    def _slots(self) -> tuple[PollSlot, ...]:
-        return (self.icon, self.monitor, self.value, self.misc)
+    # The slots created so far, in creation order
+    _slots: tuple[PollSlot, ...] = field(default=(), init=False, repr=False, compare=False)
 
-    def mark_destroyed_and_get_sources(self) -> tuple[int, ...]:
-        """Atomically marks destroyed, cancels async ops, and returns source IDs for cleanup."""
+    def __getattr__(self, name: str) -> PollSlot:
+        # Only reached while a slot attribute is still unset; afterwards the
+        # plain slot descriptor answers and this costs nothing
+        if name not in _POLL_SLOT_NAMES:
+            raise AttributeError(name)
+        with _poll_slot_create_lock:
+            try:
+                return object.__getattribute__(self, name)
+            except AttributeError:
+                slot = PollSlot()
+                object.__setattr__(self, name, slot)
+                self._slots = (*self._slots, slot)
+                return slot
+
+    def mark_destroyed(self) -> None:
+        """
+        Atomically mark destroyed, cancel async ops and remove GLib sources.
+        Sources are removed in place; no intermediate id list is built.
+        """
         with self.lock:
             self.is_destroyed = True
-            
-            # Cancel all in-flight Gio.Subprocess operations across all slots
-            for slot in self._slots:
-                if isinstance(slot.cancellable, Gio.FileMonitor):
-                    with suppress(Exception):
-                        slot.cancellable.cancel()
-                elif slot.cancellable is not None:
-                    with suppress(Exception):
+
+            with suppress(Exception):
+                for slot in self._slots:
+                    # Gio.Cancellable and Gio.FileMonitor both expose .cancel()
+                    if slot.cancellable is not None:
                         slot.cancellable.cancel()
-                slot.cancellable = None
-            
-            # Harvest source IDs
-            sources: list[int] = []
+                    if slot.watch is not None:
+                        slot.watch.cancel()
+                    if slot.bus_token:
+                        _POLL_BUS.unsubscribe(slot.bus_token)
+                    if slot.timer_token:
+                        _POLL_BUS.unsubscribe(slot.timer_token)
+                if self.debounce_source_id > 0:
+                    _glib_source_remove(self.debounce_source_id)
+
             for slot in self._slots:
-                sources.append(slot.source_id)
-                slot.source_id = 0
-            
-            sources.append(self.debounce_source_id)
+                slot.cancellable = None
+                slot.watch = None
+                slot.bus_token = 0
+                slot.timer_token = 0
             self.debounce_source_id = 0
-            
-            return tuple(sources)
 
 
 # =============================================================================
-# PROTOCOLS FOR MIXINS (Runtime Checkable)
+# PROTOCOLS FOR MIXINS (static typing only; never isinstance-checked)
 # =============================================================================
-@runtime_checkable
 class DynamicIconHost(Protocol):
     _state: WidgetState
     icon_widget: Gtk.Image
 
 
-@runtime_checkable
 class StateMonitorHost(Protocol):
     _state: WidgetState
     properties: RowProperties
@@ -337,14 +501,28 @@ def _safe_float(value: object, default: float) -> float:
     return default
 
 
-def _is_dynamic_icon(icon_config: object) -> bool:
-    if not isinstance(icon_config, dict):
-        return False
-    return (
-        icon_config.get("type") == "exec"
-        and _safe_int(icon_config.get("interval"), 0) > 0
-        and bool(icon_config.get("command", ""))
-    )
+def _is_dynamic_icon(icon: _ParsedIconConfig) -> bool:
+    return icon.kind == "exec" and icon.interval > 0 and bool(icon.command)
+
+
+@lru_cache(maxsize=256)
+def _themed_icon(name: str) -> Gio.Icon:
+    """One shared GIcon per icon name; every image showing it reuses it."""
+    return Gio.ThemedIcon.new(name)
+
+
+@lru_cache(maxsize=64)
+def _file_icon(path: str) -> Gio.Icon:
+    return Gio.FileIcon.new(Gio.File.new_for_path(path))
+
+
+def _make_prefix_icon(icon: _ParsedIconConfig) -> Gtk.Image:
+    """Build a row's prefix icon with its CSS class set at construction."""
+    if icon.kind == "file" and icon.path:
+        p = _expand_path(icon.path)
+        if p.exists():
+            return Gtk.Image(gicon=_file_icon(str(p)), css_classes=["action-row-prefix-icon"])
+    return Gtk.Image(gicon=_themed_icon(icon.name), css_classes=["action-row-prefix-icon"])
 
 
 def _perform_redirect(
@@ -354,21 +532,90 @@ def _perform_redirect(
 ) -> None:
     if not page_id or sidebar is None:
         return
-    pages = config.get("pages")
-    if not isinstance(pages, list):
-        return
-    for idx, page in enumerate(pages):
-        if isinstance(page, dict) and page.get("id") == page_id:
-            if row := sidebar.get_row_at_index(idx):
-                sidebar.select_row(row)
+    # Built once per config load; the scan only serves configs from elsewhere
+    page_index = config.get("_page_index")
+    if isinstance(page_index, dict):
+        idx = page_index.get(page_id)
+    else:
+        pages = config.get("pages")
+        if not isinstance(pages, list):
             return
+        idx = next(
+            (i for i, page in enumerate(pages)
+             if isinstance(page, dict) and page.get("id") == page_id),
+            None,
+        )
+    if idx is not None and (row := sidebar.get_row_at_index(idx)):
+        sidebar.select_row(row)
+
+
+def _compile_command_template(action: object) -> _CommandTemplate | None:
+    """Split an action's ``command`` once, at construction time."""
+    if not isinstance(action, dict):
+        return None
+    cmd = action.get("command")
+    if not cmd:
+        return None
+    return _CommandTemplate(tuple(str(cmd).split("{value}")), bool(action.get("terminal", False)))
+
 
+# ("exec", command, terminal, title) | ("redirect", page_id)
+_CompiledAction = tuple[str, str] | tuple[str, str, bool, str]
+
+
+def _compile_action(act: object, title: str) -> _CompiledAction | None:
+    """Resolve a button action once at construction so clicks skip parsing."""
+    if not isinstance(act, dict):
+        return None
+    match act.get("type"):
+        case "exec":
+            cmd = act.get("command", "")
+            if isinstance(cmd, str) and cmd.strip():
+                return ("exec", cmd.strip(), bool(act.get("terminal", False)), title)
+        case "redirect":
+            if pid := act.get("page"):
+                return ("redirect", str(pid))
+    return None
+
+
+def _compile_toggle_command(on_action: object, which: str) -> tuple[str, bool] | None:
+    """Resolve the enabled/disabled branch of a toggle action to (command, terminal)."""
+    if not isinstance(on_action, dict):
+        return None
+    act = on_action.get(which)
+    if isinstance(act, dict) and (cmd := act.get("command")):
+        if cmd := str(cmd).strip():
+            return (cmd, bool(act.get("terminal", False)))
+    return None
 
-@lru_cache(maxsize=128)
+
+def _settings_key(properties: RowProperties) -> str | None:
+    key = properties.get("key")
+    return (str(key).strip() or None) if key else None
+
+
+@lru_cache(maxsize=512)
 def _expand_path(path: str) -> Path:
     return Path(path).expanduser()
 
 
+def _read_small_text(path: str | os.PathLike[str]) -> str | None:
+    """
+    One open/read/close for single-line state files (mostly sysfs/procfs):
+    a bounded os.read replaces Path.read_text's stat + buffered decode.
+    Returns the stripped text, or None when the file can't be read.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            data = os.read(fd, LABEL_READ_MAX_BYTES)
+        finally:
+            os.close(fd)
+    except OSError:
+        return None
+    return data.decode("utf-8", "replace").strip()
+
+
 def _resolve_static_icon_name(icon_config: object) -> str:
     if isinstance(icon_config, str):
         return icon_config or DEFAULT_ICON
@@ -377,15 +624,174 @@ def _resolve_static_icon_name(icon_config: object) -> str:
     return DEFAULT_ICON
 
 
-def _safe_source_remove(source_id: int) -> None:
-    if source_id > 0:
-        with suppress(Exception):
-            GLib.source_remove(source_id)
+@lru_cache(maxsize=256)
+def _parse_icon_name(name: str) -> _ParsedIconConfig:
+    # Frozen result, so rows sharing an icon name can share the instance
+    return _ParsedIconConfig(name=name or DEFAULT_ICON)
 
 
-def _batch_source_remove(*source_ids: int) -> None:
-    for sid in source_ids:
-        _safe_source_remove(sid)
+def _parse_icon_config(icon_config: object) -> _ParsedIconConfig:
+    """Run the dict lookups and int coercion for an icon config exactly once."""
+    if isinstance(icon_config, str):
+        return _parse_icon_name(icon_config)
+    name = _resolve_static_icon_name(icon_config)
+    if not isinstance(icon_config, dict):
+        return _ParsedIconConfig(name=name)
+
+    match icon_config.get("type"):
+        case "exec":
+            command = icon_config.get("command")
+            return _ParsedIconConfig(
+                kind="exec",
+                name=name,
+                command=command.strip() if isinstance(command, str) else "",
+                interval=_safe_int(icon_config.get("interval"), 0),
+            )
+        case "file":
+            return _ParsedIconConfig(
+                kind="file", name=name, path=str(icon_config.get("path") or "")
+            )
+    return _ParsedIconConfig(name=name)
+
+
+@dataclass(slots=True)
+class _BusSubscription:
+    interval: int
+    next_due: int
+    callback: weakref.WeakMethod
+    args: tuple[Any, ...]
+
+
+class _PollBus:
+    """
+    A single 1 s GLib source shared by every poll loop and mapped timer;
+    all periodic work goes through it. Millisecond timeout_add is reserved
+    for one-shot, latency-bound timers (slider debounce).
+    Each subscriber keeps its own interval and due tick, so N polled rows
+    cost one main-loop wakeup per second instead of N. Callbacks are held
+    weakly and follow GLib semantics: returning SOURCE_REMOVE unsubscribes.
+    Main-thread only.
+    """
+
+    __slots__ = ("_subs", "_tokens", "_tick", "_source_id")
+
+    def __init__(self) -> None:
+        self._subs: dict[int, _BusSubscription] = {}
+        self._tokens = itertools.count(1)
+        self._tick = 0
+        self._source_id = 0
+
+    def subscribe(
+        self, interval: int, callback: Callable[..., bool], *args: Any, phase: int = 0
+    ) -> int:
+        """First call lands *interval* + *phase* (mod interval) ticks from now."""
+        interval = max(interval, 1)
+        token = next(self._tokens)
+        self._subs[token] = _BusSubscription(
+            interval, self._tick + interval + phase % interval, weakref.WeakMethod(callback), args
+        )
+        if not self._source_id:
+            self._source_id = GLib.timeout_add_seconds(1, self._dispatch)
+        return token
+
+    def unsubscribe(self, token: int) -> None:
+        # The shared source stops itself on the next empty tick
+        self._subs.pop(token, None)
+
+    def _dispatch(self) -> bool:
+        self._tick = tick = self._tick + 1
+        for token, sub in list(self._subs.items()):
+            if sub.next_due > tick:
+                continue
+            callback = sub.callback()
+            try:
+                keep = callback is not None and callback(*sub.args) != GLib.SOURCE_REMOVE
+            except Exception:
+                # One broken subscriber must not take the shared source (and
+                # with it every other poll loop) down: drop just that one
+                log.exception("Poll bus callback failed; unsubscribing it")
+                keep = False
+            if keep:
+                sub.next_due = tick + sub.interval
+            else:
+                self._subs.pop(token, None)
+        if self._subs:
+            return GLib.SOURCE_CONTINUE
+        self._source_id = 0
+        return GLib.SOURCE_REMOVE
+
+
+_POLL_BUS: Final[_PollBus] = _PollBus()
+
+
+# Results handed to the main loop, drained by one low-priority idle so N
+# widgets reporting in the same cycle cost a single dispatch.
+_ui_queue: Final[list[tuple[Callable[..., Any], tuple[Any, ...]]]] = []
+_ui_queue_lock: Final[threading.Lock] = threading.Lock()
+_ui_flush_scheduled = False
+
+
+def _schedule_ui(callback: Callable[..., Any], *args: Any) -> None:
+    """Run ``callback(*args)`` on the main thread; safe from any thread."""
+    global _ui_flush_scheduled
+    with _ui_queue_lock:
+        _ui_queue.append((callback, args))
+        if _ui_flush_scheduled:
+            return
+        _ui_flush_scheduled = True
+    _glib_idle_add(_flush_ui, priority=GLib.PRIORITY_LOW)
+
+
+def _flush_ui() -> bool:
+    global _ui_flush_scheduled
+    with _ui_queue_lock:
+        batch = _ui_queue[:]
+        _ui_queue.clear()
+        _ui_flush_scheduled = False
+    for callback, args in batch:
+        try:
+            callback(*args)
+        except Exception:
+            log.exception("Queued UI update failed")
+    return GLib.SOURCE_REMOVE
+
+
+@lru_cache(maxsize=256)
+def escape_markup(text: str) -> str:
+    """
+    Memoized GLib.markup_escape_text (titles repeat across pages), skipped
+    for the usual text with nothing to escape.
+    """
+    if "&" in text or "<" in text or ">" in text or "'" in text or '"' in text:
+        return GLib.markup_escape_text(text)
+    return text
+
+
+def _title_markup(properties: RowProperties, default: str) -> str:
+    """Escaped title, preferring the copy escaped once at config load."""
+    if (markup := properties.get("_title_markup")) is not None:
+        return markup
+    return escape_markup(str(properties.get("title", default)))
+
+
+def _description_markup(properties: RowProperties) -> str:
+    """Escaped description (empty when unset), preferring the pre-escaped copy."""
+    if (markup := properties.get("_desc_markup")) is not None:
+        return markup
+    sub = properties.get("description", "")
+    return escape_markup(str(sub)) if sub else ""
+
+
+def _safe_source_remove(source_id: int) -> None:
+    """
+    Destroy *source_id* only while it is still attached. A source whose
+    callback already returned SOURCE_REMOVE leaves a stale id behind, and
+    GLib.source_remove() on that logs a GLib-CRITICAL.
+    """
+    if source_id > 0:
+        source = _glib_find_source(source_id)
+        if source is not None and not source.is_destroyed():
+            source.destroy()
 
 
 def _submit_task_safe(func: Callable[[], None], state: WidgetState) -> bool:
@@ -402,43 +808,152 @@ def _submit_task_safe(func: Callable[[], None], state: WidgetState) -> bool:
 # =============================================================================
 # ASYNC SUBPROCESS INFRASTRUCTURE
 # =============================================================================
-def _parse_simple_argv(command: str) -> list[str] | None:
+# Flags never vary per poll, so one launcher is shared by every spawn
+# (all spawns happen on the main thread).
+_LAUNCHER: Final[Gio.SubprocessLauncher] = Gio.SubprocessLauncher.new(
+    Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_SILENCE
+)
+# Fire-and-forget actions: output discarded. GSubprocess installs a GLib
+# child watch per spawn, so exited children are reaped on the main loop
+# instead of lingering as zombies.
+_DETACHED_LAUNCHER: Final[Gio.SubprocessLauncher] = Gio.SubprocessLauncher.new(
+    Gio.SubprocessFlags.STDOUT_SILENCE | Gio.SubprocessFlags.STDERR_SILENCE
+)
+
+
+def _spawn_detached(command: str) -> bool:
+    """Run *command* through /bin/sh without waiting for it."""
+    try:
+        _DETACHED_LAUNCHER.spawnv(("/bin/sh", "-c", command))
+        return True
+    except GLib.Error as e:
+        log.debug("Failed to spawn '%.30s...': %s", command, e.message)
+        return False
+
+
+@lru_cache(maxsize=256)
+def _parse_simple_argv(command: str) -> tuple[str, ...] | None:
     """
-    Attempt to decompose *command* into a direct-exec argv list.
-    Returns the argv list when the command is a straightforward executable
+    Attempt to decompose *command* into a direct-exec argv tuple.
+    Memoized: polled commands are fixed for a widget's lifetime.
+    Returns the argv tuple when the command is a straightforward executable
     invocation (e.g. ``brightnessctl get``).
     Returns ``None`` when shell features are detected (pipes, redirections, 
     variable expansion, globs, etc.), signalling that /bin/sh -c is required.
     """
-    # Fast O(n) set-intersection check — cheaper than a regex for short
-    # polling commands and avoids compiling a pattern at import time.
-    if _SHELL_METACHAR.intersection(command):
+    # Any deleted character means a metacharacter was present.
+    if len(command.translate(_SHELL_METACHAR_TABLE)) != len(command):
         return None
     try:
         argv = shlex.split(command)
-        return argv if argv else None
+        return tuple(argv) if argv else None
     except ValueError:
         # Malformed quoting — let the shell figure it out.
         return None
 
 
+def _idle_complete_none(on_complete: Callable[[str | None], None]) -> bool:
+    """Idle callback reporting a failed spawn to *on_complete*."""
+    on_complete(None)
+    return GLib.SOURCE_REMOVE
+
+
+def _cat_target(argv: tuple[str, ...]) -> str | None:
+    """Return the file of a plain ``cat /abs/path`` argv, else ``None``."""
+    if len(argv) == 2 and argv[0] in _CAT_BINARIES and argv[1].startswith("/"):
+        return argv[1]
+    return None
+
+
+def _read_file_async(
+    path: str,
+    on_complete: Callable[[str | None], None],
+    cancellable: Gio.Cancellable | None = None,
+) -> Gio.Cancellable:
+    """
+    Read *path* asynchronously in place of spawning ``cat``; *on_complete*
+    receives the stripped contents, or ``None`` when empty or unreadable.
+    """
+    if cancellable is None:
+        cancellable = Gio.Cancellable()
+
+    def on_loaded(gfile: Gio.File, result: Gio.AsyncResult) -> None:
+        try:
+            success, contents, _etag = gfile.load_contents_finish(result)
+        except GLib.Error:
+            on_complete(None)
+            return
+        text = contents.decode("utf-8", errors="replace").strip() if success else ""
+        on_complete(text or None)
+
+    Gio.File.new_for_path(path).load_contents_async(cancellable, on_loaded)
+    return cancellable
+
+
+# Shell-wrapped commands get their own process group via setsid(1), so a
+# timeout or cancel can kill the whole pipeline, not just /bin/sh. Gio's
+# child is never a group leader, so setsid execs in place: pid == pgid.
+_SHELL_ARGV_PREFIX: Final[tuple[str, ...]] = (
+    ("setsid", "/bin/sh", "-c") if shutil.which("setsid") else ("/bin/sh", "-c")
+)
+
+
+def _command_argv(command: str) -> tuple[str, ...]:
+    """
+    Resolve *command* to the argv that will be spawned.
+    **Optimization**: simple commands (no pipes, redirections, variable
+    expansion) are exec'd directly, avoiding the fork+exec overhead of
+    ``/bin/sh -c`` on every polling tick.
+    """
+    return _parse_simple_argv(command) or (*_SHELL_ARGV_PREFIX, command)
+
+
+def _force_exit_group(proc: Gio.Subprocess) -> None:
+    """SIGKILL *proc* and, when it leads its own process group, its children."""
+    if (ident := proc.get_identifier()) is not None:
+        pid = int(ident)
+        with suppress(OSError):
+            if os.getpgid(pid) == pid:
+                os.killpg(pid, signal.SIGKILL)
+                return
+    proc.force_exit()
+
+
 def _run_shell_async(
     command: str,
     timeout_seconds: int,
     on_complete: Callable[[str | None], None],
+) -> Gio.Cancellable | None:
+    """Asynchronously run *command*, invoking *on_complete* on the main thread."""
+    return _run_argv_async(_command_argv(command), timeout_seconds, on_complete)
+
+
+def _run_argv_async(
+    argv: tuple[str, ...],
+    timeout_seconds: int,
+    on_complete: Callable[[str | None], None],
+    cancellable: Gio.Cancellable | None = None,
+    *,
+    on_failed_output: Callable[[str], None] | None = None,
+    on_timed_out: Callable[[], None] | None = None,
 ) -> Gio.Cancellable | None:
     """
-    Asynchronously run *command*, invoking *on_complete* on the main thread.
-    **Optimization**: simple commands (no pipes, redirections, variable
-    expansion) are exec'd directly, avoiding the fork+exec overhead of
-    ``/bin/sh -c`` on every polling tick.
+    Asynchronously spawn a pre-split *argv*, invoking *on_complete* on the
+    main thread with stripped stdout, or ``None`` on failure.
+    A caller-owned *cancellable* may be passed in to avoid an allocation.
+    When given, *on_failed_output* instead receives the stripped stdout of
+    a run that finished with a non-zero exit status, and *on_timed_out* is
+    called instead of *on_complete* when the watchdog kills the run.
     """
-    cancellable = Gio.Cancellable()
+    if cancellable is None:
+        cancellable = Gio.Cancellable()
     timeout_source_id: int = 0
+    timed_out = False
     
     def on_timeout() -> bool:
-        nonlocal timeout_source_id
+        nonlocal timeout_source_id, timed_out
         timeout_source_id = 0  
+        timed_out = True
         if not cancellable.is_cancelled():
             cancellable.cancel()
         return GLib.SOURCE_REMOVE
@@ -455,24 +970,24 @@ def _run_shell_async(
             success, stdout_data, _ = proc.communicate_utf8_finish(result)
             if success and proc.get_successful() and stdout_data:
                 on_complete(stdout_data.strip())
+            elif success and on_failed_output is not None and not proc.get_successful():
+                on_failed_output(stdout_data.strip() if stdout_data else "")
             else:
                 on_complete(None)
         except GLib.Error:
-            on_complete(None)
-
-    # Direct exec when possible; shell wrapper only when necessary.
-    argv = _parse_simple_argv(command)
-    if argv is None:
-        argv = ["/bin/sh", "-c", command]
+            # Timed out or cancelled: cancelling only abandons the pipes, so
+            # kill the command (and any pipeline under it) too
+            _force_exit_group(proc)
+            if timed_out and on_timed_out is not None:
+                on_timed_out()
+            else:
+                on_complete(None)
 
     try:
-        launcher = Gio.SubprocessLauncher.new(
-            Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_SILENCE
-        )
-        proc = launcher.spawnv(argv)
+        proc = _LAUNCHER.spawnv(argv)
     except GLib.Error as e:
-        log.debug("Failed to spawn command '%.30s...': %s", command, e.message)
-        GLib.idle_add(lambda: (on_complete(None), GLib.SOURCE_REMOVE)[1])
+        log.debug("Failed to spawn command '%.30s...': %s", argv[-1], e.message)
+        _glib_idle_add(_idle_complete_none, on_complete)
         return None
 
     if timeout_seconds > 0:
@@ -492,6 +1007,66 @@ class AsyncPollingMixin:
     the map-check / destroy-check logic across all widgets.
     """
     _state: WidgetState
+    # Slots registered through _start_mapped_timer / _start_poll_loop;
+    # map/unmap are hooked on first use
+    _mapped_timer_slots: tuple[PollSlot, ...] = ()
+    _bus_slots: tuple[PollSlot, ...] = ()
+    _map_hooks_connected: bool = False
+
+    def _connect_map_hooks(self) -> None:
+        if not self._map_hooks_connected:
+            self._map_hooks_connected = True
+            self.connect("map", self._on_map_resume_timers)
+            self.connect("unmap", self._on_unmap_suspend_timers)
+
+    def _start_mapped_timer(
+        self,
+        slot: PollSlot,
+        interval: int,
+        tick: Callable[[], bool],
+    ) -> None:
+        """
+        Run *tick* every *interval* seconds, but only while the widget is
+        mapped: the _POLL_BUS subscription is dropped on "unmap" and renewed
+        on "map", so rows on background pages cost nothing at all.
+        """
+        self._connect_map_hooks()
+        self._mapped_timer_slots = (*self._mapped_timer_slots, slot)
+
+        with self._state.lock:
+            if self._state.is_destroyed:
+                return
+            slot.interval = interval
+            slot.tick = tick
+            if self.get_mapped() and slot.timer_token == 0:
+                slot.timer_token = _POLL_BUS.subscribe(interval, tick)
+
+    def _on_map_resume_timers(self, _widget: Gtk.Widget) -> None:
+        with self._state.lock:
+            if self._state.is_destroyed:
+                return
+            for slot in self._mapped_timer_slots:
+                if slot.timer_token == 0 and slot.tick is not None:
+                    slot.timer_token = _POLL_BUS.subscribe(slot.interval, slot.tick)
+            parked = []
+            for slot in self._bus_slots:
+                slot.unmapped_since = 0
+                if slot.bus_token == 0 and slot.bus_args is not None:
+                    self._subscribe_poll(slot)
+                    parked.append(slot)
+        # Parked loops missed at least POLL_PARK_AFTER_US of updates
+        for slot in parked:
+            _, on_output, timeout, _fast = slot.bus_args
+            self._poll_command(slot, on_output, timeout)
+
+    def _on_unmap_suspend_timers(self, _widget: Gtk.Widget) -> None:
+        with self._state.lock:
+            if self._state.is_destroyed:
+                return
+            for slot in self._mapped_timer_slots:
+                if slot.timer_token:
+                    _POLL_BUS.unsubscribe(slot.timer_token)
+                    slot.timer_token = 0
 
     def _start_poll_loop(
         self,
@@ -502,64 +1077,188 @@ class AsyncPollingMixin:
         timeout: int = 2,
         *,
         immediate: bool = True,
+        fast: bool = False,
     ) -> None:
         """
         Begin a periodic polling loop bound to a specific state *slot*.
         Safely replaces any existing timer on the same slot.
+        The command is split into argv once here; ticks never re-parse it.
+        *fast* commands get no per-run timeout watchdog; the next tick
+        cancels a run that is still going instead.
         """
+        if fast:
+            timeout = 0
+        interval = max(interval, 1)
+
+        argv = _command_argv(command)
+        read_path = _cat_target(argv)
+        with self._state.lock:
+            slot.argv = argv
+            slot.read_path = read_path
+
+        # `cat <regular file>`: inotify replaces the timer entirely
+        if (
+            read_path is not None
+            and not read_path.startswith(_PSEUDO_FS_PREFIXES)
+            and self._start_file_watch(slot, read_path, on_output)
+        ):
+            if immediate:
+                self._poll_command(slot, on_output, timeout)
+            return
+
         if immediate:
-            self._poll_command(slot, command, on_output, timeout)
+            self._poll_command(slot, on_output, timeout)
+
+        if not any(s is slot for s in self._bus_slots):
+            self._connect_map_hooks()
+            self._bus_slots = (*self._bus_slots, slot)
 
         with self._state.lock:
             if self._state.is_destroyed:
                 return
-            if slot.source_id > 0:
-                GLib.source_remove(slot.source_id)
-            slot.source_id = GLib.timeout_add_seconds(
-                interval, self._poll_tick, slot, command, on_output, timeout,
+            if slot.bus_token:
+                _POLL_BUS.unsubscribe(slot.bus_token)
+            slot.bus_args = (interval, on_output, timeout, fast)
+            self._subscribe_poll(slot)
+
+    def _subscribe_poll(self, slot: PollSlot) -> None:
+        """Subscribe *slot* to _POLL_BUS from its stored bus_args (lock held)."""
+        interval, on_output, timeout, fast = slot.bus_args
+        slot.bus_token = _POLL_BUS.subscribe(
+            interval, self._poll_tick, slot, on_output, timeout, fast,
+            phase=hash(slot.argv),
+        )
+
+    def _start_file_watch(
+        self,
+        slot: PollSlot,
+        path: str,
+        on_output: Callable[[str], None],
+    ) -> bool:
+        """Watch *path* with Gio.FileMonitor; False means fall back to polling."""
+        try:
+            monitor = Gio.File.new_for_path(path).monitor_file(
+                Gio.FileMonitorFlags.NONE, None
             )
+        except GLib.Error as e:
+            log.debug("File watch unavailable for %s: %s", path, e.message)
+            return False
+
+        monitor.connect("changed", self._on_watched_file_changed, slot, on_output)
+        with self._state.lock:
+            if self._state.is_destroyed:
+                monitor.cancel()
+                return True
+            if slot.watch is not None:
+                slot.watch.cancel()
+            slot.watch = monitor
+        return True
+
+    def _on_watched_file_changed(
+        self,
+        monitor: Gio.FileMonitor,
+        file: Gio.File,
+        other_file: Gio.File | None,
+        event_type: Gio.FileMonitorEvent,
+        slot: PollSlot,
+        on_output: Callable[[str], None],
+    ) -> None:
+        if event_type in (Gio.FileMonitorEvent.CHANGES_DONE_HINT, Gio.FileMonitorEvent.CREATED):
+            self._poll_command(slot, on_output, 0, shared=False)
 
     def _poll_tick(
         self,
         slot: PollSlot,
-        command: str,
         on_output: Callable[[str], None],
         timeout: int,
+        fast: bool = False,
     ) -> bool:
-        """GLib timeout callback — skips unmapped widgets, guards concurrency."""
+        """
+        _POLL_BUS callback — skips unmapped widgets, guards concurrency.
+        Lock-free: poll-engine slots are only written on the main thread
+        (GIO callbacks run there too), and single attribute reads are atomic.
+        """
         if isinstance(self, Gtk.Widget) and not self.get_mapped():
+            # Brief unmaps keep the subscription; long ones park the loop
+            # until "map" so background pages cost no wakeups at all
+            now = GLib.get_monotonic_time()
+            if not slot.unmapped_since:
+                slot.unmapped_since = now
+            elif now - slot.unmapped_since >= POLL_PARK_AFTER_US:
+                slot.unmapped_since = 0
+                slot.bus_token = 0
+                return GLib.SOURCE_REMOVE
             return GLib.SOURCE_CONTINUE
 
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return GLib.SOURCE_REMOVE
-            if slot.is_running:
-                return GLib.SOURCE_CONTINUE
+        if self._state.is_destroyed:
+            return GLib.SOURCE_REMOVE
+        if slot.is_running:
+            if fast and (cancellable := slot.cancellable) is not None:
+                # Stand-in for the skipped watchdog: drop a stalled run
+                with suppress(Exception):
+                    cancellable.cancel()
+            return GLib.SOURCE_CONTINUE
 
-        self._poll_command(slot, command, on_output, timeout)
+        self._poll_command(slot, on_output, timeout)
         return GLib.SOURCE_CONTINUE
 
     def _poll_command(
         self,
         slot: PollSlot,
-        command: str,
         on_output: Callable[[str], None],
         timeout: int,
+        *,
+        shared: bool = True,
     ) -> None:
-        """Cancel any in-flight operation on *slot*, then launch a new one."""
+        """
+        Cancel any in-flight operation on *slot*, then launch a new one.
+        *shared* lets the run be served from _poll_cache or piggyback on an
+        identical in-flight command; change-triggered reads pass False.
+        """
+        argv = slot.argv
+        if shared and argv is not None:
+            if (cached_output := _cached_poll_output(argv)) is not None:
+                if not self._state.is_destroyed:
+                    on_output(cached_output)
+                return
+            if (waiters := _poll_waiters.get(argv)) is not None:
+                # Another widget is already running this exact command
+                slot.is_running = True
+                waiters.append(partial(self._on_shared_result, slot, on_output))
+                return
+
         with self._state.lock:
-            if self._state.is_destroyed:
+            if self._state.is_destroyed or argv is None:
                 slot.is_running = False
                 return
             slot.is_running = True
-            if slot.cancellable is not None:
+            in_flight = slot.cancellable
+            if in_flight is not None:
                 with suppress(Exception):
-                    slot.cancellable.cancel()
+                    in_flight.cancel()
                 slot.cancellable = None
 
+            reusable = slot.persistent_cancellable
+            if reusable is None or reusable is in_flight:
+                # Never reset() a cancellable an unfinished run still holds
+                reusable = slot.persistent_cancellable = Gio.Cancellable()
+            else:
+                reusable.reset()
+            slot.token += 1
+            token = slot.token
+
+        waiters: list[Callable[[str | None], None]] = []
+        # Only runs with a watchdog are joinable. A fast run (or a file read)
+        # ends only when its owner cancels it, and an unmapped or parked
+        # owner never would, stranding every waiter in is_running.
+        if timeout > 0 and slot.read_path is None:
+            _poll_waiters[argv] = waiters
+
         def on_result(output: str | None) -> None:
+            _publish_poll_output(argv, waiters, output)
+
             with self._state.lock:
-                if slot.cancellable is cancellable:
+                if slot.token == token:
                     slot.cancellable = None
                     slot.is_running = False
                 if self._state.is_destroyed:
@@ -568,11 +1267,13 @@ class AsyncPollingMixin:
                 on_output(output)
 
         try:
-            cancellable = _run_shell_async(command, timeout, on_result)
+            if slot.read_path is not None:
+                cancellable = _read_file_async(slot.read_path, on_result, reusable)
+            else:
+                cancellable = _run_argv_async(argv, timeout, on_result, reusable)
         except Exception as e:
             log.error("Failed to execute async shell command: %s", e)
-            with self._state.lock:
-                slot.is_running = False
+            on_result(None)
             return
 
         with self._state.lock:
@@ -583,6 +1284,17 @@ class AsyncPollingMixin:
                     cancellable.cancel()
                 slot.is_running = False
 
+    def _on_shared_result(
+        self,
+        slot: PollSlot,
+        on_output: Callable[[str], None],
+        output: str | None,
+    ) -> None:
+        """Receive the output of a run another widget started for our argv."""
+        slot.is_running = False
+        if output is not None and not self._state.is_destroyed:
+            on_output(output)
+
 
 # =============================================================================
 # REFACTORED MIXINS (Using Unified Engine)
@@ -590,41 +1302,85 @@ class AsyncPollingMixin:
 class DynamicIconMixin(AsyncPollingMixin):
     """Mixin providing dynamic icon updates via periodic command execution."""
     icon_widget: Gtk.Image
-
-    def _start_icon_update_loop(self, icon_config: dict[str, object]) -> None:
-        interval = _safe_int(icon_config.get("interval"), DEFAULT_INTERVAL_SECONDS)
-        command = icon_config.get("command")
-
-        if isinstance(command, str) and command.strip():
+    _pending_icon_name: str
+    # Last name pushed to icon_widget; compared in Python instead of a GObject getter
+    _last_icon_name: str | None = None
+    # Handler applying an icon that arrived while unmapped; connected on first use
+    _icon_map_handler: int = 0
+
+    def _start_icon_update_loop(self, icon: _ParsedIconConfig) -> None:
+        if icon.command:
             self._start_poll_loop(
                 self._state.icon,
-                command.strip(),
-                interval,
+                icon.command,
+                max(icon.interval or DEFAULT_INTERVAL_SECONDS, MIN_MONITOR_INTERVAL_SECONDS),
                 on_output=self._apply_icon_update,
                 timeout=SUBPROCESS_TIMEOUT_SHORT,
+                fast=True,
             )
 
     def _apply_icon_update(self, new_icon: str) -> None:
+        """Queue the icon change at low priority so input redraws go first."""
         new_icon = new_icon.strip()
-        if new_icon and self.icon_widget.get_icon_name() != new_icon:
-            self.icon_widget.set_from_icon_name(new_icon)
+        if not new_icon:
+            return
+        with self._state.lock:
+            if self._state.icon.pending_idle:
+                self._pending_icon_name = new_icon
+                return
+            if new_icon == self._last_icon_name:
+                return
+            self._pending_icon_name = new_icon
+            self._state.icon.pending_idle = True
+        _schedule_ui(self._flush_icon_update)
+
+    def _flush_icon_update(self) -> bool:
+        with self._state.lock:
+            self._state.icon.pending_idle = False
+            if self._state.is_destroyed:
+                return GLib.SOURCE_REMOVE
+            new_icon = self._pending_icon_name
+        if new_icon == self._last_icon_name:
+            return GLib.SOURCE_REMOVE
+        if not self.get_mapped():
+            # Off-screen (e.g. a page still being built): keep only the
+            # latest name and set it once on "map" instead of per update
+            if not self._icon_map_handler:
+                self._icon_map_handler = self.connect("map", self._on_map_flush_icon)
+            return GLib.SOURCE_REMOVE
+        self._last_icon_name = new_icon
+        self.icon_widget.set_from_gicon(_themed_icon(new_icon))
+        return GLib.SOURCE_REMOVE
+
+    def _on_map_flush_icon(self, _widget: Gtk.Widget) -> None:
+        if self._state.is_destroyed:  # GIL-protected bool load
+            return
+        new_icon = getattr(self, "_pending_icon_name", None)
+        if new_icon is not None and new_icon != self._last_icon_name:
+            self._last_icon_name = new_icon
+            self.icon_widget.set_from_gicon(_themed_icon(new_icon))
 
 
 class StateMonitorMixin(AsyncPollingMixin):
     """Mixin providing external state monitoring via native inotify or polling."""
     properties: RowProperties
+    _pending_state: bool
+    _settings_key: str | None
 
     def _start_state_monitor(self) -> None:
-        has_key = bool(self.properties.get("key", ""))
+        key = self._settings_key
         state_cmd = self.properties.get("state_command", "")
         has_state_cmd = isinstance(state_cmd, str) and bool(state_cmd.strip())
 
-        if not has_key and not has_state_cmd:
+        if not key and not has_state_cmd:
             return
 
         if has_state_cmd:
             # Command based states still require polling
-            interval = _safe_int(self.properties.get("interval"), MONITOR_INTERVAL_SECONDS)
+            interval = max(
+                _safe_int(self.properties.get("interval"), MONITOR_INTERVAL_SECONDS),
+                MIN_MONITOR_INTERVAL_SECONDS,
+            )
             self._start_poll_loop(
                 self._state.monitor,
                 state_cmd.strip(),
@@ -634,28 +1390,47 @@ class StateMonitorMixin(AsyncPollingMixin):
                 immediate=False,
             )
         else:
-            # Native Linux inotify event listener (Zero CPU idle)
-            key = str(self.properties.get("key", "")).strip()
+            # Native Linux inotify event listener (Zero CPU idle). Every toggle
+            # on the same key shares the settings cache's single monitor.
             file_path = utility.SETTINGS_DIR / key
             try:
                 file_path.parent.mkdir(parents=True, exist_ok=True)
                 if not file_path.exists():
                     file_path.touch()
-                
-                gfile = Gio.File.new_for_path(str(file_path))
-                monitor = gfile.monitor_file(Gio.FileMonitorFlags.NONE, None)
-                monitor.connect("changed", self._on_file_changed)
-                
-                # Note: Gio.FileMonitor is stored in the cancellable field for cleanup parity.
-                # Both FileMonitor and Cancellable expose .cancel(), enabling shared teardown logic.
-                with self._state.lock:
-                    self._state.monitor.cancellable = monitor
-            except Exception as e:
+            except OSError as e:
                 log.error(f"File monitor setup failed for {key}: {e}")
+                return
+
+            watch = utility.watch_setting(key, self._on_file_changed)
+            if watch is None:
+                log.error(f"File monitor setup failed for {key}")
+                return
+            # Note: the watch handle is stored in the cancellable field for cleanup parity.
+            # It exposes .cancel() like Gio.Cancellable, enabling shared teardown logic.
+            with self._state.lock:
+                if self._state.is_destroyed:
+                    watch.cancel()
+                else:
+                    self._state.monitor.cancellable = watch
 
     def _handle_state_output(self, output: str) -> None:
-        new_state = output.strip().lower() in TRUE_VALUES
+        """Queue the polled state at low priority, coalescing bursts."""
+        with self._state.lock:
+            # Output arrives stripped from _run_argv_async
+            self._pending_state = output in _TRUE_VALUES_ALLCASE
+            if self._state.monitor.pending_idle:
+                return
+            self._state.monitor.pending_idle = True
+        _schedule_ui(self._flush_polled_state)
+
+    def _flush_polled_state(self) -> bool:
+        with self._state.lock:
+            self._state.monitor.pending_idle = False
+            if self._state.is_destroyed:
+                return GLib.SOURCE_REMOVE
+            new_state = self._pending_state
         self._apply_state_update(new_state)
+        return GLib.SOURCE_REMOVE
 
     def _on_file_changed(
         self,
@@ -664,28 +1439,47 @@ class StateMonitorMixin(AsyncPollingMixin):
         other_file: Gio.File | None,
         event_type: Gio.FileMonitorEvent
     ) -> None:
+        if self._state.is_destroyed:  # GIL-protected bool load
+            return
+
+        if isinstance(self, Gtk.Widget) and not self.get_mapped():
+            return
+
+        if event_type in (Gio.FileMonitorEvent.CHANGES_DONE_HINT, Gio.FileMonitorEvent.CREATED):
+            # Coalesce event bursts: at most one queued flush reads the latest value
+            with self._state.lock:
+                if self._state.monitor.pending_idle:
+                    return
+                self._state.monitor.pending_idle = True
+            _glib_idle_add(self._flush_file_state)
+
+    def _flush_file_state(self) -> bool:
         with self._state.lock:
+            self._state.monitor.pending_idle = False
             if self._state.is_destroyed:
-                return
-
-        if isinstance(self, Gtk.Widget) and not self.get_mapped():
-            return
+                return GLib.SOURCE_REMOVE
 
-        if event_type in (Gio.FileMonitorEvent.CHANGES_DONE_HINT, Gio.FileMonitorEvent.CREATED):
-            key = str(self.properties.get("key", "")).strip()
-            val = utility.load_setting(key, default=False)
-            if isinstance(val, bool):
-                self._apply_state_update(val)
+        if not (key := self._settings_key):
+            return GLib.SOURCE_REMOVE
+        val = utility.load_setting(key, default=False)
+        if isinstance(val, bool):
+            self._apply_state_update(val)
+        return GLib.SOURCE_REMOVE
 
     def _apply_state_update(self, new_state: bool) -> bool:
         raise NotImplementedError
 
 
 class SliderMonitorMixin(AsyncPollingMixin):
-    """Mixin providing numeric value monitoring via periodic polling."""
+    """Mixin providing numeric value monitoring via inotify or periodic polling."""
     properties: RowProperties
 
     def _start_value_monitor(self) -> None:
+        value_file = self.properties.get("value_file", "")
+        if isinstance(value_file, str) and value_file.strip():
+            self._start_value_file_monitor(value_file.strip())
+            return
+
         cmd = self.properties.get("value_command", "")
         if not isinstance(cmd, str) or not cmd.strip():
             return
@@ -698,8 +1492,48 @@ class SliderMonitorMixin(AsyncPollingMixin):
             interval,
             on_output=self._handle_value_output,
             timeout=SUBPROCESS_TIMEOUT_SHORT,
+            fast=True,
         )
 
+    def _start_value_file_monitor(self, path_str: str) -> None:
+        """File-backed values are re-read only when inotify reports a change."""
+        gfile = Gio.File.new_for_path(str(_expand_path(path_str)))
+        try:
+            monitor = gfile.monitor_file(Gio.FileMonitorFlags.NONE, None)
+        except GLib.Error as e:
+            log.error("Value file monitor setup failed for %s: %s", path_str, e.message)
+            return
+        monitor.connect("changed", self._on_value_file_changed)
+
+        # Stored in the cancellable field so teardown cancels it like the others.
+        with self._state.lock:
+            if self._state.is_destroyed:
+                monitor.cancel()
+                return
+            self._state.value.cancellable = monitor
+
+        gfile.load_contents_async(None, self._on_value_file_loaded)
+
+    def _on_value_file_changed(
+        self,
+        monitor: Gio.FileMonitor,
+        file: Gio.File,
+        other_file: Gio.File | None,
+        event_type: Gio.FileMonitorEvent,
+    ) -> None:
+        if event_type in (Gio.FileMonitorEvent.CHANGES_DONE_HINT, Gio.FileMonitorEvent.CREATED):
+            file.load_contents_async(None, self._on_value_file_loaded)
+
+    def _on_value_file_loaded(self, file: Gio.File, result: Gio.AsyncResult) -> None:
+        if self._state.is_destroyed:  # GIL-protected bool load
+            return
+        try:
+            success, contents, _etag = file.load_contents_finish(result)
+        except GLib.Error:
+            return
+        if success:
+            self._handle_value_output(contents.decode("utf-8", errors="replace"))
+
     def _handle_value_output(self, output: str) -> None:
         try:
             new_value = float(output.strip())
@@ -732,47 +1566,28 @@ class BaseActionRow(DynamicIconMixin, Adw.ActionRow):
         self._state = WidgetState()
         self.properties = properties
         self.on_action: ActionConfig = on_action or {}
-        self.context: RowContext = context or {}
-        self.config: dict[str, object] = self.context.get("config") or {}
-        self.sidebar: Gtk.ListBox | None = self.context.get("sidebar")
-        self.toast_overlay: Adw.ToastOverlay | None = self.context.get("toast_overlay")
-        self.nav_view: Adw.NavigationView | None = self.context.get("nav_view")
-        self.builder_func = self.context.get("builder_func")
-
-        title = str(properties.get("title", "Unnamed"))
-        self.set_title(GLib.markup_escape_text(title))
-        if sub := properties.get("description", ""):
-            self.set_subtitle(GLib.markup_escape_text(str(sub)))
-
-        icon_config = properties.get("icon", DEFAULT_ICON)
-        self.icon_widget = self._create_icon_widget(icon_config)
+        self.context: RowContext = context if context is not None else _EMPTY_CONTEXT
+        self.config: Mapping[str, object] = self.context.config
+        self.sidebar: Gtk.ListBox | None = self.context.sidebar
+        self.toast_overlay: Adw.ToastOverlay | None = self.context.toast_overlay
+        self.nav_view: Adw.NavigationView | None = self.context.nav_view
+        self.builder_func = self.context.builder_func
+
+        self.set_title(_title_markup(properties, "Unnamed"))
+        if sub := _description_markup(properties):
+            self.set_subtitle(sub)
+
+        icon_config = _parse_icon_config(properties.get("icon", DEFAULT_ICON))
+        self.icon_widget = _make_prefix_icon(icon_config)
         self.add_prefix(self.icon_widget)
 
-        if _is_dynamic_icon(icon_config) and isinstance(icon_config, dict):
+        if _is_dynamic_icon(icon_config):
             self._start_icon_update_loop(icon_config)
 
-    def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    return img
-
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
-        return img
-
     def do_unroot(self) -> None:
-        self._perform_cleanup()
+        self._state.mark_destroyed()
         Adw.ActionRow.do_unroot(self)
 
-    def _perform_cleanup(self) -> None:
-        sources = self._state.mark_destroyed_and_get_sources()
-        _batch_source_remove(*sources)
-
 
 # =============================================================================
 # ROW IMPLEMENTATIONS
@@ -789,6 +1604,7 @@ class ButtonRow(BaseActionRow):
         super().__init__(properties, on_press, context)
 
         multi_buttons = properties.get("buttons")
+        title = str(properties.get("title", "Command"))
         
         if multi_buttons and isinstance(multi_buttons, list):
             box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=0)
@@ -796,85 +1612,119 @@ class ButtonRow(BaseActionRow):
             box.set_valign(Gtk.Align.CENTER)
             
             for btn_cfg in multi_buttons:
-                b = Gtk.Button()
+                # Fully configure each button through constructor properties
+                # before parenting, so its CSS node is styled once.
+                text = str(btn_cfg.get("button_text", "Action"))
+                style_cls = _BUTTON_STYLE_CLASSES.get(str(btn_cfg.get("style", "")))
+                css_classes = [style_cls] if style_cls else []
                 if icon_name := btn_cfg.get("icon"):
-                    b.set_child(Gtk.Image.new_from_icon_name(icon_name))
-                    b.set_tooltip_text(str(btn_cfg.get("button_text", "Action")))
+                    b = Gtk.Button(
+                        child=Gtk.Image.new_from_gicon(_themed_icon(str(icon_name))),
+                        tooltip_text=text,
+                        css_classes=css_classes,
+                    )
                 else:
-                    b.set_label(str(btn_cfg.get("button_text", "Action")))
-                
-                b.connect("clicked", self._on_multi_clicked, btn_cfg)
-                if s := btn_cfg.get("style"):
-                    if s == "suggested": b.add_css_class("suggested-action")
-                    elif s == "destructive": b.add_css_class("destructive-action")
+                    b = Gtk.Button(label=text, css_classes=css_classes)
+                compiled = _compile_action(btn_cfg.get("on_press"), title)
+                if compiled is not None:
+                    b.connect("clicked", partial(self._dispatch_compiled, compiled))
                 box.append(b)
+            # Box is complete before the row sees it: a single insertion
             self.add_suffix(box)
         else:
-            self.btn = Gtk.Button(label=str(properties.get("button_text", "Run")))
+            # Python-side copy of the button label; avoids a get_label() per update
+            self._last_label = str(properties.get("button_text", "Run"))
+            self.btn = Gtk.Button(label=self._last_label)
             self.btn.set_valign(Gtk.Align.CENTER)
             self.btn.add_css_class("run-btn")
             
+            self._current_style: str | None = None
             self.base_style = str(properties.get("style", "default")).lower()
             self._apply_base_style(self.base_style)
             
             self.text_file = properties.get("button_text_file")
+            self._last_stamp: tuple[int, int] | None = None
             if self.text_file:
                 self.text_map = properties.get("button_text_map", {})
                 self.style_map = properties.get("style_map", {})
                 self._start_dynamic_poll()
 
-            self.btn.connect("clicked", self._on_button_clicked)
+            compiled = _compile_action(self.on_action, title)
+            if compiled is not None:
+                self.btn.connect("clicked", partial(self._dispatch_compiled, compiled))
             self.add_suffix(self.btn)
             self.set_activatable_widget(self.btn)
 
     def _apply_base_style(self, style: str) -> None:
-        for s in ["suggested-action", "destructive-action", "default-action"]:
-            self.btn.remove_css_class(s)
-        match style:
-            case "destructive": self.btn.add_css_class("destructive-action")
-            case "suggested": self.btn.add_css_class("suggested-action")
-            case _: self.btn.add_css_class("default-action")
+        # Touch the CSS node only on an actual change; every class swap
+        # invalidates the button's style.
+        if style == self._current_style:
+            return
+        if self._current_style is not None:
+            self.btn.remove_css_class(_BUTTON_STYLE_CLASSES.get(self._current_style, "default-action"))
+        self.btn.add_css_class(_BUTTON_STYLE_CLASSES.get(style, "default-action"))
+        self._current_style = style
 
     def _start_dynamic_poll(self) -> None:
-        # Use 'misc' slot for button text polling
+        # Use 'misc' slot for button text monitoring
         self._update_dynamic_state()
+        try:
+            gfile = Gio.File.new_for_path(str(_expand_path(self.text_file)))
+            monitor = gfile.monitor_file(Gio.FileMonitorFlags.NONE, None)
+        except GLib.Error as e:
+            # e.g. filesystems without inotify support: fall back to polling
+            log.debug("Button text monitor unavailable for %s: %s", self.text_file, e.message)
+            self._start_mapped_timer(self._state.misc, 2, self._update_dynamic_state)
+            return
+
+        monitor.connect("changed", self._on_text_file_changed)
         with self._state.lock:
-            if not self._state.is_destroyed:
-                self._state.misc.source_id = GLib.timeout_add_seconds(2, self._update_dynamic_state)
+            if self._state.is_destroyed:
+                monitor.cancel()
+                return
+            self._state.misc.watch = monitor
+
+    def _on_text_file_changed(
+        self,
+        monitor: Gio.FileMonitor,
+        file: Gio.File,
+        other_file: Gio.File | None,
+        event_type: Gio.FileMonitorEvent,
+    ) -> None:
+        if event_type in (Gio.FileMonitorEvent.CHANGES_DONE_HINT, Gio.FileMonitorEvent.CREATED):
+            self._update_dynamic_state()
 
     def _update_dynamic_state(self) -> bool:
         try:
-            path = Path(self.text_file).expanduser()
-            if not path.exists(): return True
-            val = path.read_text().strip()
-            new_label = self.text_map.get(val, self.text_map.get("default", self.btn.get_label()))
-            if self.btn.get_label() != new_label: self.btn.set_label(new_label)
+            path = _expand_path(self.text_file)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError: return True
+            # Unchanged mtime+size means unchanged text; pseudo filesystems
+            # keep a constant mtime, so those are always re-read.
+            if not str(path).startswith(_PSEUDO_FS_PREFIXES):
+                stamp = (st.st_mtime_ns, st.st_size)
+                if stamp == self._last_stamp: return True
+                self._last_stamp = stamp
+            if (val := _read_small_text(path)) is None: return True
+            new_label = self.text_map.get(val, self.text_map.get("default", self._last_label))
+            if new_label != self._last_label:
+                self.btn.set_label(new_label)
+                self._last_label = new_label
             new_style = self.style_map.get(val, self.style_map.get("default", self.base_style))
-            self._apply_base_style(new_style)
+            if new_style != self._current_style:
+                self._apply_base_style(new_style)
         except Exception: pass
         return True
 
-    def _on_button_clicked(self, _button: Gtk.Button) -> None:
-        self._trigger_action(self.on_action)
-
-    def _on_multi_clicked(self, _b: Gtk.Button, cfg: dict[str, Any]) -> None:
-        if act := cfg.get("on_press"):
-            self._trigger_action(act)
-
-    def _trigger_action(self, act: Any) -> None:
-        if not isinstance(act, dict): return
-        t = act.get("type")
-        if t == "exec":
-            cmd = act.get("command", "")
-            if isinstance(cmd, str) and cmd.strip():
-                title = str(self.properties.get("title", "Command"))
-                term = bool(act.get("terminal", False))
-                success = utility.execute_command(cmd.strip(), title, term)
-                msg = f"{'▶ Launched' if success else '✖ Failed'}: {title}"
-                utility.toast(self.toast_overlay, msg, 2 if success else 4)
-        elif t == "redirect":
-            if pid := act.get("page"):
-                _perform_redirect(str(pid), self.config, self.sidebar)
+    def _dispatch_compiled(self, compiled: _CompiledAction, _button: Gtk.Button) -> None:
+        if compiled[0] == "exec":
+            _, cmd, term, title = compiled
+            success = utility.execute_command(cmd, title, term)
+            msg = f"{'▶ Launched' if success else '✖ Failed'}: {title}"
+            utility.toast(self.toast_overlay, msg, 2 if success else 4)
+        else:
+            _perform_redirect(compiled[1], self.config, self.sidebar)
 
 
 class ToggleRow(StateMonitorMixin, BaseActionRow):
@@ -893,8 +1743,12 @@ class ToggleRow(StateMonitorMixin, BaseActionRow):
         self.toggle_switch = Gtk.Switch()
         self.toggle_switch.set_valign(Gtk.Align.CENTER)
 
-        if key := properties.get("key"):
-            val = utility.load_setting(str(key).strip(), default=False)
+        self._enabled_cmd = _compile_toggle_command(self.on_action, "enabled")
+        self._disabled_cmd = _compile_toggle_command(self.on_action, "disabled")
+        self._settings_key = _settings_key(properties)
+
+        if self._settings_key:
+            val = utility.load_setting(self._settings_key, default=False)
             if isinstance(val, bool):
                 self.toggle_switch.set_active(val)
 
@@ -904,8 +1758,8 @@ class ToggleRow(StateMonitorMixin, BaseActionRow):
         self._start_state_monitor()
 
     def _apply_state_update(self, new_state: bool) -> bool:
-        with self._state.lock:
-            if self._state.is_destroyed: return GLib.SOURCE_REMOVE
+        if self._state.is_destroyed:  # GIL-protected bool load
+            return GLib.SOURCE_REMOVE
 
         if new_state != self.toggle_switch.get_active():
             self._programmatic_update_event.set()
@@ -920,16 +1774,12 @@ class ToggleRow(StateMonitorMixin, BaseActionRow):
         if self._programmatic_update_event.is_set():
             return False
 
-        if isinstance(self.on_action, dict):
-            action_key = "enabled" if state else "disabled"
-            if action := self.on_action.get(action_key):
-                if isinstance(action, dict) and (cmd := action.get("command")):
-                    utility.execute_command(str(cmd).strip(), "Toggle", bool(action.get("terminal", False)))
+        if act := (self._enabled_cmd if state else self._disabled_cmd):
+            utility.execute_command(act[0], "Toggle", act[1])
 
         # Offload file I/O to thread pool to prevent main thread blocking
-        if key := self.properties.get("key"):
-            key_str = str(key).strip()
-            _submit_task_safe(lambda: utility.save_setting(key_str, state), self._state)
+        if key_str := self._settings_key:
+            _submit_task_safe(partial(utility.save_setting, key_str, state), self._state)
 
         return False
 
@@ -946,7 +1796,14 @@ class LabelRow(BaseActionRow):
         super().__init__(properties, None, context)
 
         self.value_config: ValueConfig = value if value is not None else LABEL_NA
+        self._resolved_file_path: str | None = None
+        # One-shot exec values: parsed once here instead of per refresh
+        self._exec_argv: tuple[str, ...] | None = None
+        self._exec_read_path: str | None = None
+        if isinstance(self.value_config, dict) and self.value_config.get("type") == "exec":
+            self._compile_exec(str(self.value_config.get("command", "")).strip())
         self.value_label = Gtk.Label(label=LABEL_PLACEHOLDER, css_classes=["dim-label"])
+        self._last_label: str = LABEL_PLACEHOLDER
         self.value_label.set_valign(Gtk.Align.CENTER)
         self.value_label.set_halign(Gtk.Align.END)
         self.value_label.set_hexpand(True)
@@ -959,7 +1816,9 @@ class LabelRow(BaseActionRow):
         # to strictly avoid thread pool starvation.
         is_exec = isinstance(self.value_config, dict) and self.value_config.get("type") == "exec"
         
-        if is_exec and interval > 0:
+        if is_exec and self.value_config.get("stream"):
+            self._start_stream(str(self.value_config.get("command", "")).strip())
+        elif is_exec and interval > 0:
             val_dict = self.value_config
             cmd = ""
             if isinstance(val_dict, dict):
@@ -977,23 +1836,106 @@ class LabelRow(BaseActionRow):
                 self._update_label(LABEL_NA)
         else:
             self._trigger_update()
-            if interval > 0:
-                with self._state.lock:
-                    if not self._state.is_destroyed:
-                        # LabelRow uses the 'value' slot for updates
-                        self._state.value.source_id = GLib.timeout_add_seconds(
-                            interval, self._on_timeout
-                        )
+            if interval > 0 and not self._start_value_file_watch():
+                # LabelRow uses the 'value' slot for updates
+                self._start_mapped_timer(self._state.value, interval, self._on_timeout)
+
+    def _start_value_file_watch(self) -> bool:
+        """Watch a ``type: file`` value with inotify instead of a timer.
+
+        Returns False when the value is not a watchable file, so the caller
+        keeps interval polling (pseudo-filesystems never emit change events).
+        """
+        val = self.value_config
+        if not isinstance(val, dict) or val.get("type") != "file":
+            return False
+        raw_path = str(val.get("path", "")).strip()
+        if not raw_path:
+            return False
+        path = str(_expand_path(raw_path))
+        if path.startswith(_PSEUDO_FS_PREFIXES):
+            return False
+        try:
+            monitor = Gio.File.new_for_path(path).monitor_file(Gio.FileMonitorFlags.NONE, None)
+        except GLib.Error as e:
+            log.debug("Value file monitor unavailable for %s: %s", path, e.message)
+            return False
+
+        monitor.connect("changed", self._on_value_file_changed)
+        with self._state.lock:
+            if self._state.is_destroyed:
+                monitor.cancel()
+            else:
+                self._state.value.watch = monitor
+        return True
+
+    def _on_value_file_changed(
+        self,
+        monitor: Gio.FileMonitor,
+        file: Gio.File,
+        other_file: Gio.File | None,
+        event_type: Gio.FileMonitorEvent,
+    ) -> None:
+        if event_type in (
+            Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+            Gio.FileMonitorEvent.CREATED,
+            Gio.FileMonitorEvent.DELETED,
+        ):
+            self._trigger_update()
+
+    def _start_stream(self, cmd: str) -> None:
+        """
+        Spawn *cmd* once and show each line it prints (``stream: true``),
+        e.g. ``playerctl metadata --follow``. Lines are read asynchronously
+        on the main loop; unrooting cancels the read and kills the process.
+        """
+        if not cmd:
+            self._update_label(LABEL_NA)
+            return
+        try:
+            proc = _LAUNCHER.spawnv(_command_argv(cmd))
+        except GLib.Error as e:
+            log.debug("Failed to spawn stream '%.30s...': %s", cmd, e.message)
+            self._update_label(LABEL_ERROR)
+            return
+
+        cancellable = Gio.Cancellable()
+        with self._state.lock:
+            if self._state.is_destroyed:
+                _force_exit_group(proc)
+                return
+            self._state.value.cancellable = cancellable
+
+        stream = Gio.DataInputStream.new(proc.get_stdout_pipe())
+        stream.read_line_async(
+            GLib.PRIORITY_DEFAULT, cancellable, self._on_stream_line, (proc, cancellable)
+        )
+
+    def _on_stream_line(
+        self,
+        stream: Gio.DataInputStream,
+        result: Gio.AsyncResult,
+        data: tuple[Gio.Subprocess, Gio.Cancellable],
+    ) -> None:
+        proc, cancellable = data
+        try:
+            line, _length = stream.read_line_finish_utf8(result)
+        except GLib.Error:
+            # Cancelled on unroot (or the pipe broke): don't leave it running
+            _force_exit_group(proc)
+            return
+        if line is None:
+            return  # EOF: the command exited; keep its last value
+        self._update_label(line.strip() or LABEL_NA)
+        stream.read_line_async(GLib.PRIORITY_DEFAULT, cancellable, self._on_stream_line, data)
 
     def _handle_async_output(self, output: str) -> None:
         """Callback for Gio async loop execution."""
         self._update_label(output.strip() if output else LABEL_NA)
 
     def _on_timeout(self) -> bool:
-        if isinstance(self, Gtk.Widget) and not self.get_mapped():
-            return GLib.SOURCE_CONTINUE
-        with self._state.lock:
-            if self._state.is_destroyed: return GLib.SOURCE_REMOVE
+        if self._state.is_destroyed:  # GIL-protected bool load
+            return GLib.SOURCE_REMOVE
         self._trigger_update()
         return GLib.SOURCE_CONTINUE
 
@@ -1003,27 +1945,80 @@ class LabelRow(BaseActionRow):
                 return
             self._state.value.is_running = True
 
+        if (argv := self._exec_argv) is not None:
+            # Rows showing the same command (say `uname -r` on several pages)
+            # reuse a fresh result, and poll loops may join this row's run.
+            # The row never joins someone else's run, though: if that owner
+            # is torn down mid-run its waiters get None, and a one-shot
+            # label is never refreshed to recover from N/A.
+            if (cached := _cached_poll_output(argv)) is not None:
+                self._on_exec_output(cached)
+                return
+            waiters: list[Callable[[str | None], None]] = []
+            if argv not in _poll_waiters:
+                _poll_waiters[argv] = waiters
+
+            def on_complete(output: str | None) -> None:
+                _publish_poll_output(argv, waiters, output)
+                self._on_exec_output(output)
+
+            def on_failed_output(output: str) -> None:
+                # Labels show stdout whatever the exit status: `systemctl
+                # is-active` prints "inactive" with status 3, `grep -c` a "0"
+                # with status 1. Poll loops only take successful runs, so
+                # this output is shown but not shared.
+                _publish_poll_output(argv, waiters, None)
+                self._on_exec_output(output)
+
+            def on_timed_out() -> None:
+                _publish_poll_output(argv, waiters, None)
+                self._on_exec_output(LABEL_TIMEOUT)
+
+            # Commands complete on the main loop; no worker thread blocks on them
+            cancellable = _run_argv_async(
+                argv, SUBPROCESS_TIMEOUT_LONG, on_complete,
+                on_failed_output=on_failed_output, on_timed_out=on_timed_out,
+            )
+            with self._state.lock:
+                if self._state.is_destroyed:
+                    if cancellable is not None:
+                        cancellable.cancel()
+                else:
+                    self._state.value.cancellable = cancellable
+            return
+
         if not _submit_task_safe(self._load_value_async, self._state):
             with self._state.lock:
                 self._state.value.is_running = False
 
+    def _on_exec_output(self, output: str | None) -> None:
+        with self._state.lock:
+            self._state.value.is_running = False
+            self._state.value.cancellable = None
+            if self._state.is_destroyed: return
+        self._update_label(output or LABEL_NA)
+
     def _load_value_async(self) -> None:
         result = LABEL_NA
         try:
-            with self._state.lock:
-                if self._state.is_destroyed: return
+            if self._state.is_destroyed:  # GIL-protected bool load
+                return
             result = self._get_value_text(self.value_config)
         finally:
             with self._state.lock:
                 self._state.value.is_running = False
 
-        GLib.idle_add(self._update_label, result)
+        # Unchanged values (temperatures, battery %) need no main-loop hop;
+        # _last_label is only written on the main thread, so this read is safe
+        if result != self._last_label:
+            _schedule_ui(self._update_label, result)
 
     def _update_label(self, text: str) -> bool:
-        with self._state.lock:
-            if self._state.is_destroyed: return GLib.SOURCE_REMOVE
-        if self.value_label.get_label() != text:
+        if self._state.is_destroyed:  # GIL-protected bool load
+            return GLib.SOURCE_REMOVE
+        if text != self._last_label:
             self.value_label.set_label(text)
+            self._last_label = text
             self.value_label.remove_css_class("dim-label")
         return GLib.SOURCE_REMOVE
 
@@ -1031,33 +2026,41 @@ class LabelRow(BaseActionRow):
         if isinstance(val, str): return val
         if not isinstance(val, dict): return LABEL_NA
         match val.get("type"):
-            case "exec": return self._exec_cmd(str(val.get("command", "")))
+            case "exec":
+                # Only `cat <file>` reaches here; other commands run via Gio
+                if self._exec_read_path is None: return LABEL_NA
+                return self._read_path(self._exec_read_path)
             case "static": return str(val.get("text", LABEL_NA))
-            case "file": return self._read_file(str(val.get("path", "")))
+            case "file":
+                if self._resolved_file_path is None:
+                    raw = str(val.get("path", "")).strip()
+                    if not raw: return LABEL_NA
+                    self._resolved_file_path = os.fspath(_expand_path(raw))
+                return self._read_path(self._resolved_file_path)
             case "system":
                 result = utility.get_system_value(str(val.get("key", "")))
                 return str(result) if result else LABEL_NA
         return LABEL_NA
 
-    def _exec_cmd(self, cmd: str) -> str:
-        cmd = cmd.strip()
-        if not cmd: return LABEL_NA
+    def _compile_exec(self, cmd: str) -> None:
+        if not cmd: return
         if cmd.startswith("cat "):
             try:
                 parts = shlex.split(cmd)
-                if len(parts) == 2: return self._read_file(parts[1])
-            except ValueError: pass
-        try:
-            res = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=SUBPROCESS_TIMEOUT_LONG)
-            return res.stdout.strip() or LABEL_NA
-        except subprocess.TimeoutExpired: return LABEL_TIMEOUT
-        except subprocess.SubprocessError: return LABEL_ERROR
+            except ValueError:
+                parts = []
+            if len(parts) == 2:
+                # Stored fully expanded: each refresh is just the raw read
+                if path := parts[1].strip():
+                    self._exec_read_path = os.fspath(_expand_path(path))
+                return
+        # Simple commands exec directly; only metachar-bearing ones pay for /bin/sh
+        self._exec_argv = _command_argv(cmd)
 
-    def _read_file(self, path: str) -> str:
-        if not path.strip(): return LABEL_NA
-        try:
-            return _expand_path(path.strip()).read_text(encoding="utf-8").strip()
-        except OSError: return LABEL_NA
+    @staticmethod
+    def _read_path(path: str) -> str:
+        text = _read_small_text(path)
+        return LABEL_NA if text is None else text
 
 
 class SliderRow(SliderMonitorMixin, BaseActionRow):
@@ -1077,10 +2080,21 @@ class SliderRow(SliderMonitorMixin, BaseActionRow):
         self.step_val = step if step > MIN_STEP_VALUE else 1.0
         self.debounce_enabled = bool(properties.get("debounce", True))
 
-        # ---- feedback-loop guard (no lock needed — main thread only) ----
-        self._slider_changing: bool = False
-        self._last_snapped: float | None = None
+        # Grid positions as integer step indices; drags compare ints, not floats
+        self._inv_step = 1.0 / self.step_val
+        self._min_idx = round(self.min_val * self._inv_step)
+        self._max_idx = round(self.max_val * self._inv_step)
+
+        self._command_template = (
+            _compile_command_template(self.on_action)
+            if isinstance(self.on_action, dict) and self.on_action.get("type") == "exec"
+            else None
+        )
+
+        # ---- drag state (no lock needed — main thread only) ----
+        self._last_step_idx: int | None = None
         self._pending_value: float | None = None
+        self._last_change_us = 0  # Monotonic time of the latest step change
 
         default_val = _safe_float(properties.get("default"), self.min_val)
         adj = Gtk.Adjustment(
@@ -1093,55 +2107,44 @@ class SliderRow(SliderMonitorMixin, BaseActionRow):
         self.slider.set_hexpand(False)
         self.slider.set_draw_value(False)
         self.slider.set_size_request(250, -1)
-        self.slider.connect("value-changed", self._on_value_changed)
+        self._value_changed_id = self.slider.connect("value-changed", self._on_value_changed)
         self.add_suffix(self.slider)
 
         self._start_value_monitor()
 
     def _apply_value_update(self, new_value: float) -> bool:
         """Push a polled value into the slider, suppressing feedback."""
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return GLib.SOURCE_REMOVE
+        if self._state.is_destroyed:  # GIL-protected bool load
+            return GLib.SOURCE_REMOVE
 
         current = self.slider.get_value()
         if abs(current - new_value) < self.step_val:
             return GLib.SOURCE_REMOVE
 
-        # Guard against the synchronous value-changed re-entry.
-        self._slider_changing = True
+        safe_val = max(self.min_val, min(new_value, self.max_val))
+        self._set_value_silently(safe_val)
+        self._last_step_idx = round(safe_val * self._inv_step)
+        return GLib.SOURCE_REMOVE
+
+    def _set_value_silently(self, value: float) -> None:
+        """set_value() with our handler blocked, so GTK never re-enters it."""
+        self.slider.handler_block(self._value_changed_id)
         try:
-            safe_val = max(self.min_val, min(new_value, self.max_val))
-            self.slider.set_value(safe_val)
-            self._last_snapped = safe_val
+            self.slider.set_value(value)
         finally:
-            self._slider_changing = False
-
-        return GLib.SOURCE_REMOVE
+            self.slider.handler_unblock(self._value_changed_id)
 
     def _on_value_changed(self, scale: Gtk.Scale) -> None:
-        # Re-entrant call from set_value() inside this class — ignore.
-        if self._slider_changing:
-            return
-
         val = scale.get_value()
-        snapped = round(val / self.step_val) * self.step_val
-        snapped = max(self.min_val, min(snapped, self.max_val))
-
-        if (
-            self._last_snapped is not None
-            and abs(snapped - self._last_snapped) < MIN_STEP_VALUE
-        ):
+        step_idx = max(self._min_idx, min(round(val * self._inv_step), self._max_idx))
+        if step_idx == self._last_step_idx:
             return
-        self._last_snapped = snapped
+        self._last_step_idx = step_idx
+        snapped = max(self.min_val, min(step_idx * self.step_val, self.max_val))
 
         # Snap the visual handle if it drifted from the grid.
         if abs(snapped - val) > MIN_STEP_VALUE:
-            self._slider_changing = True
-            try:
-                self.slider.set_value(snapped)
-            finally:
-                self._slider_changing = False
+            self._set_value_silently(snapped)
 
         self._pending_value = snapped
 
@@ -1149,20 +2152,32 @@ class SliderRow(SliderMonitorMixin, BaseActionRow):
             self._execute_debounced_action()
             return
 
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return
-            old_id = self._state.debounce_source_id
-            self._state.debounce_source_id = GLib.timeout_add(
+        # Lock-free: debounce_source_id is only ever touched on the main
+        # thread (this handler, the timer itself and do_unroot).
+        # A drag only stamps the time; one armed timer pushes itself back
+        # until the handle rests, instead of a remove+add per step.
+        state = self._state
+        if state.is_destroyed:
+            return
+        self._last_change_us = GLib.get_monotonic_time()
+        if not state.debounce_source_id:
+            state.debounce_source_id = GLib.timeout_add(
                 SLIDER_DEBOUNCE_MS, self._execute_debounced_action
             )
-        _safe_source_remove(old_id)
 
     def _execute_debounced_action(self) -> bool:
-        with self._state.lock:
-            if self._state.is_destroyed:
+        state = self._state
+        if state.is_destroyed:
+            return GLib.SOURCE_REMOVE
+        state.debounce_source_id = 0
+
+        if self.debounce_enabled:
+            idle_ms = (GLib.get_monotonic_time() - self._last_change_us) // 1000
+            if idle_ms < SLIDER_DEBOUNCE_MS:
+                state.debounce_source_id = GLib.timeout_add(
+                    SLIDER_DEBOUNCE_MS - idle_ms, self._execute_debounced_action
+                )
                 return GLib.SOURCE_REMOVE
-            self._state.debounce_source_id = 0
 
         value = self._pending_value
         self._pending_value = None
@@ -1170,19 +2185,12 @@ class SliderRow(SliderMonitorMixin, BaseActionRow):
         if value is None:
             return GLib.SOURCE_REMOVE
 
-        if isinstance(self.on_action, dict) and self.on_action.get("type") == "exec":
-            if cmd := self.on_action.get("command"):
-                final_cmd = str(cmd).replace("{value}", str(int(value)))
-                is_term = bool(self.on_action.get("terminal", False))
-                if is_term:
-                    utility.execute_command(final_cmd, "Slider", True)
-                else:
-                    subprocess.Popen(
-                        final_cmd,
-                        shell=True,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                    )
+        if (template := self._command_template) is not None:
+            final_cmd = template.fill(str(int(value)))
+            if template.terminal:
+                utility.execute_command(final_cmd, "Slider", True)
+            else:
+                _spawn_detached(final_cmd)
         return GLib.SOURCE_REMOVE
 
 
@@ -1201,24 +2209,27 @@ class SelectionRow(DynamicIconMixin, Adw.ComboRow):
         self._state = WidgetState()
         self.properties = properties
         self.on_action: ActionConfig = on_change or {}
-        self.context: RowContext = context or {}
-        self.toast_overlay: Adw.ToastOverlay | None = self.context.get("toast_overlay")
+        self.context: RowContext = context if context is not None else _EMPTY_CONTEXT
+        self.toast_overlay: Adw.ToastOverlay | None = self.context.toast_overlay
+        # Per-option command templates, compiled on first selection
+        self._command_templates: dict[str, _CommandTemplate | None] = {}
         
         self._programmatic_update = False
 
-        title = str(properties.get("title", "Unnamed"))
-        self.set_title(GLib.markup_escape_text(title))
-        if sub := properties.get("description", ""):
-            self.set_subtitle(GLib.markup_escape_text(str(sub)))
+        self.set_title(_title_markup(properties, "Unnamed"))
+        if sub := _description_markup(properties):
+            self.set_subtitle(sub)
 
-        icon_config = properties.get("icon", DEFAULT_ICON)
-        self.icon_widget = self._create_icon_widget(icon_config)
+        icon_config = _parse_icon_config(properties.get("icon", DEFAULT_ICON))
+        self.icon_widget = _make_prefix_icon(icon_config)
         self.add_prefix(self.icon_widget)
 
         self.options_list: list[str] = []
+        self._options_key: tuple[str, ...] = ()
         raw_options = properties.get("options", [])
         if isinstance(raw_options, list) and raw_options:
             self.options_list = [str(x) for x in raw_options]
+            self._options_key = tuple(self.options_list)
             self.set_model(Gtk.StringList.new(self.options_list))
 
         raw_map = properties.get("options_map", {})
@@ -1228,11 +2239,11 @@ class SelectionRow(DynamicIconMixin, Adw.ComboRow):
         self.connect("notify::selected", self._on_selected)
         self.connect("map", self._on_map)
 
-        if _is_dynamic_icon(icon_config) and isinstance(icon_config, dict):
+        if _is_dynamic_icon(icon_config):
             self._start_icon_update_loop(icon_config)
 
         if properties.get("options_command"):
-            _submit_task_safe(self._fetch_options_async, self._state)
+            self._fetch_options()
 
         if key := properties.get("key"):
             val = utility.load_setting(str(key).strip(), default="")
@@ -1245,93 +2256,115 @@ class SelectionRow(DynamicIconMixin, Adw.ComboRow):
         if properties.get("value_command") or properties.get("key"):
             self._start_selection_monitor()
 
-    def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    return img
-
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
-        return img
-
     @contextmanager
     def _suppress_change_signal(self):
         self._programmatic_update = True
         try: yield
         finally: self._programmatic_update = False
 
-    def _fetch_options_async(self) -> None:
+    def _fetch_options(self) -> None:
         cmd = self.properties.get("options_command", "")
         if not cmd: return
-        try:
-            res = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=SUBPROCESS_TIMEOUT_LONG)
-            if res.returncode == 0:
-                lines = [line.strip() for line in res.stdout.splitlines() if line.strip()]
-                if lines: GLib.idle_add(self._update_options_ui, lines)
-        except Exception as e:
-            log.error(f"Options fetch failed: {e}")
+        _run_shell_async(str(cmd), SUBPROCESS_TIMEOUT_LONG, self._on_options_output)
+
+    def _on_options_output(self, output: str | None) -> None:
+        if output is None: return
+        lines = [line.strip() for line in output.splitlines() if line.strip()]
+        if lines: self._update_options_ui(lines)
 
     def _update_options_ui(self, new_options: list[str]) -> bool:
-        with self._state.lock:
-            if self._state.is_destroyed: return GLib.SOURCE_REMOVE
-        if new_options != self.options_list:
-            self.options_list = new_options
-            with self._suppress_change_signal():
-                self.set_model(Gtk.StringList.new(self.options_list))
-                _submit_task_safe(self._fetch_selection_async, self._state)
+        if self._state.is_destroyed:  # GIL-protected bool load
+            return GLib.SOURCE_REMOVE
+        new_key = tuple(new_options)
+        if new_key == self._options_key:
+            return GLib.SOURCE_REMOVE
+
+        old_key = self._options_key
+        idx = self.get_selected()
+        old_item = old_key[idx] if idx < len(old_key) else None
+        self._options_key = new_key
+        self.options_list = new_options
+
+        with self._suppress_change_signal():
+            model = self.get_model()
+            if isinstance(model, Gtk.StringList) and self._splice_options(model, old_key, new_key):
+                # Selected entry untouched by the patch: no need to re-read it
+                idx = self.get_selected()
+                if old_item is not None and idx < len(new_key) and new_key[idx] == old_item:
+                    return GLib.SOURCE_REMOVE
+            else:
+                # Rebuilding the model recreates every popover row; reserve
+                # it for large changes.
+                self.set_model(Gtk.StringList.new(new_options))
+            self._fetch_selection()
         return GLib.SOURCE_REMOVE
 
+    @staticmethod
+    def _splice_options(
+        model: Gtk.StringList, old: tuple[str, ...], new: tuple[str, ...]
+    ) -> bool:
+        """Patch ``model`` from ``old`` to ``new`` in one splice when the changed
+        span is small; returns False if a full rebuild is the better choice."""
+        limit = min(len(old), len(new))
+        head = 0
+        while head < limit and old[head] == new[head]:
+            head += 1
+        tail = 0
+        while tail < limit - head and old[-1 - tail] == new[-1 - tail]:
+            tail += 1
+        n_removals = len(old) - head - tail
+        additions = new[head:len(new) - tail]
+        if max(n_removals, len(additions)) > OPTIONS_SPLICE_MAX:
+            return False
+        model.splice(head, n_removals, list(additions))
+        return True
+
     def _start_selection_monitor(self) -> None:
         # SelectionRow uses 'value' slot for selection monitoring
         interval = _safe_int(self.properties.get("interval"), DEFAULT_INTERVAL_SECONDS)
-        with self._state.lock:
-            if self._state.is_destroyed: return
-            self._state.value.source_id = GLib.timeout_add_seconds(interval, self._check_selection_tick)
+        self._start_mapped_timer(self._state.value, interval, self._check_selection_tick)
 
     def _on_map(self, _widget: Gtk.Widget) -> None:
-        _submit_task_safe(self._fetch_selection_async, self._state)
+        self._fetch_selection()
         if self.properties.get("options_command"):
-             _submit_task_safe(self._fetch_options_async, self._state)
+            self._fetch_options()
 
     def _check_selection_tick(self) -> bool:
-        if not self.get_mapped(): return GLib.SOURCE_CONTINUE
-        with self._state.lock:
-            if self._state.is_destroyed: return GLib.SOURCE_REMOVE
-        _submit_task_safe(self._fetch_selection_async, self._state)
+        if self._state.is_destroyed:  # GIL-protected bool load
+            return GLib.SOURCE_REMOVE
+        self._fetch_selection()
         return GLib.SOURCE_CONTINUE
 
-    def _fetch_selection_async(self) -> None:
-        if key := self.properties.get("key"):
-            try:
-                val = utility.load_setting(str(key).strip(), default="")
-                val_lower = str(val).lower()
-                mapped_val = self.options_map.get(val_lower, str(val))
-                if mapped_val: GLib.idle_add(self._update_selection_ui, mapped_val)
-            except Exception: pass
+    def _fetch_selection(self) -> None:
+        # Settings files stay on the I/O pool; commands go through Gio.Subprocess
+        if self.properties.get("key"):
+            _submit_task_safe(self._fetch_selection_async, self._state)
             return
 
         cmd = self.properties.get("value_command", "")
         if not cmd: return
+        _run_shell_async(str(cmd), SUBPROCESS_TIMEOUT_SHORT, self._on_selection_output)
+
+    def _fetch_selection_async(self) -> None:
+        key = self.properties.get("key")
         try:
-            res = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=SUBPROCESS_TIMEOUT_SHORT)
-            if res.returncode == 0:
-                value = res.stdout.strip()
-                value_lower = value.lower()
-                mapped_val = self.options_map.get(value_lower, value)
-                if mapped_val: GLib.idle_add(self._update_selection_ui, mapped_val)
+            val = utility.load_setting(str(key).strip(), default="")
+            val_lower = str(val).lower()
+            mapped_val = self.options_map.get(val_lower, str(val))
+            if mapped_val: _schedule_ui(self._update_selection_ui, mapped_val)
         except Exception: pass
 
+    def _on_selection_output(self, output: str | None) -> None:
+        if output is None: return
+        mapped_val = self.options_map.get(output.lower(), output)
+        if mapped_val: self._update_selection_ui(mapped_val)
+
     def _update_selection_ui(self, value: str) -> bool:
-        with self._state.lock:
-            if self._state.is_destroyed: return GLib.SOURCE_REMOVE
+        if self._state.is_destroyed:  # GIL-protected bool load
+            return GLib.SOURCE_REMOVE
         if value not in self.options_list:
             if self.properties.get("options_command"):
-                 _submit_task_safe(self._fetch_options_async, self._state)
+                self._fetch_options()
             return GLib.SOURCE_REMOVE
         idx = self.options_list.index(value)
         if self.get_selected() != idx:
@@ -1352,21 +2385,28 @@ class SelectionRow(DynamicIconMixin, Adw.ComboRow):
             key_str = str(key).strip()
             write_val = self.reverse_map.get(item, item)
 
-            _submit_task_safe(lambda: utility.save_setting(key_str, write_val), self._state)
+            _submit_task_safe(partial(utility.save_setting, key_str, write_val), self._state)
 
+        if (template := self._command_template_for(item)) is not None:
+            final_cmd = template.fill(shlex.quote(item))
+            utility.execute_command(final_cmd, "Selection", template.terminal)
+
+    def _command_template_for(self, item: str) -> _CommandTemplate | None:
+        try:
+            return self._command_templates[item]
+        except KeyError:
+            pass
+        template = None
         if isinstance(self.on_action, dict):
             action = self.on_action.get(item)
             if not isinstance(action, dict) and "command" in self.on_action:
                 action = self.on_action
-
-            if isinstance(action, dict) and (cmd := action.get("command")):
-                safe_value = shlex.quote(item)
-                final_cmd = str(cmd).replace("{value}", safe_value)
-                utility.execute_command(final_cmd, "Selection", bool(action.get("terminal", False)))
+            template = _compile_command_template(action)
+        self._command_templates[item] = template
+        return template
 
     def do_unroot(self) -> None:
-        sources = self._state.mark_destroyed_and_get_sources()
-        _batch_source_remove(*sources)
+        self._state.mark_destroyed()
         Adw.ComboRow.do_unroot(self)
 
 
@@ -1385,14 +2425,13 @@ class EntryRow(DynamicIconMixin, Adw.EntryRow):
         self._state = WidgetState()
         self.properties = properties
         self.on_action: ActionConfig = on_action or {}
-        self.context: RowContext = context or {}
-        self.toast_overlay: Adw.ToastOverlay | None = self.context.get("toast_overlay")
+        self.context: RowContext = context if context is not None else _EMPTY_CONTEXT
+        self.toast_overlay: Adw.ToastOverlay | None = self.context.toast_overlay
 
-        title = str(properties.get("title", "Unnamed"))
-        self.set_title(GLib.markup_escape_text(title))
+        self.set_title(_title_markup(properties, "Unnamed"))
 
-        icon_config = properties.get("icon", DEFAULT_ICON)
-        self.icon_widget = self._create_icon_widget(icon_config)
+        icon_config = _parse_icon_config(properties.get("icon", DEFAULT_ICON))
+        self.icon_widget = _make_prefix_icon(icon_config)
         self.add_prefix(self.icon_widget)
 
         self.set_show_apply_button(False)
@@ -1402,34 +2441,19 @@ class EntryRow(DynamicIconMixin, Adw.EntryRow):
         btn.set_valign(Gtk.Align.CENTER)
         btn.connect("clicked", self._on_apply)
         self.add_suffix(btn)
+        self._command_template = _compile_command_template(self.on_action)
 
-        if _is_dynamic_icon(icon_config) and isinstance(icon_config, dict):
+        if _is_dynamic_icon(icon_config):
             self._start_icon_update_loop(icon_config)
 
-    def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    return img
-
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
-        return img
-
     def _on_apply(self, _btn: Gtk.Button) -> None:
         text = self.get_text()
         if not text: return
-        if isinstance(self.on_action, dict) and (cmd := self.on_action.get("command")):
-            final_cmd = str(cmd).replace("{value}", text)
-            utility.execute_command(final_cmd, "Entry", bool(self.on_action.get("terminal", False)))
+        if (template := self._command_template) is not None:
+            utility.execute_command(template.fill(text), "Entry", template.terminal)
 
     def do_unroot(self) -> None:
-        sources = self._state.mark_destroyed_and_get_sources()
-        _batch_source_remove(*sources)
+        self._state.mark_destroyed()
         Adw.EntryRow.do_unroot(self)
 
 
@@ -1444,17 +2468,14 @@ class NavigationRow(BaseActionRow):
     ) -> None:
         super().__init__(properties, None, context)
         self.layout_data: list[object] = layout_data or []
-        self.add_suffix(Gtk.Image.new_from_icon_name("go-next-symbolic"))
+        self.add_suffix(Gtk.Image.new_from_gicon(_themed_icon("go-next-symbolic")))
         self.set_activatable(True)
         self.connect("activated", self._on_activated)
 
     def _on_activated(self, _row: Adw.ActionRow) -> None:
         if self.nav_view and self.builder_func:
             title = str(self.properties.get("title", "Subpage"))
-            current_path = self.context.get("path", [])
-            new_path = list(current_path) + [title]
-            new_ctx = self.context.copy()
-            new_ctx["path"] = new_path
+            new_ctx = replace(self.context, path=(*self.context.path, title))
             self.nav_view.push(self.builder_func(title, self.layout_data, new_ctx))
 
 
@@ -1472,39 +2493,36 @@ class ExpanderRow(DynamicIconMixin, Adw.ExpanderRow):
         self._state = WidgetState()
         self.properties = properties
         self.items_data: list[object] = items or []
-        self.context: RowContext = context or {}
-        self.toast_overlay: Adw.ToastOverlay | None = self.context.get("toast_overlay")
-        self.nav_view: Adw.NavigationView | None = self.context.get("nav_view")
-        self.builder_func = self.context.get("builder_func")
-
-        title = str(properties.get("title", "Expander"))
-        self.set_title(GLib.markup_escape_text(title))
-        if sub := properties.get("description", ""):
-            self.set_subtitle(GLib.markup_escape_text(str(sub)))
-
-        icon_config = properties.get("icon", DEFAULT_ICON)
-        self.icon_widget = self._create_icon_widget(icon_config)
+        self.context: RowContext = context if context is not None else _EMPTY_CONTEXT
+        self.toast_overlay: Adw.ToastOverlay | None = self.context.toast_overlay
+        self.nav_view: Adw.NavigationView | None = self.context.nav_view
+        self.builder_func = self.context.builder_func
+
+        self.set_title(_title_markup(properties, "Expander"))
+        if sub := _description_markup(properties):
+            self.set_subtitle(sub)
+
+        icon_config = _parse_icon_config(properties.get("icon", DEFAULT_ICON))
+        self.icon_widget = _make_prefix_icon(icon_config)
         self.add_prefix(self.icon_widget)
 
-        self._build_child_rows()
+        # Children (and their pollers) are only built once the user expands
+        self._built = False
+        if self.get_expanded():
+            self._build_child_rows()
+        else:
+            self._expand_handler = self.connect("notify::expanded", self._on_expanded_changed)
 
-        if _is_dynamic_icon(icon_config) and isinstance(icon_config, dict):
+        if _is_dynamic_icon(icon_config):
             self._start_icon_update_loop(icon_config)
 
-    def _create_icon_widget(self, icon: object) -> Gtk.Image:
-        if isinstance(icon, dict) and icon.get("type") == "file":
-            if path := icon.get("path"):
-                p = _expand_path(str(path))
-                if p.exists():
-                    img = Gtk.Image.new_from_file(str(p))
-                    img.add_css_class("action-row-prefix-icon")
-                    return img
-        icon_name = _resolve_static_icon_name(icon)
-        img = Gtk.Image.new_from_icon_name(icon_name)
-        img.add_css_class("action-row-prefix-icon")
-        return img
+    def _on_expanded_changed(self, _row: Adw.ExpanderRow, _param: GObject.ParamSpec) -> None:
+        if self.get_expanded() and not self._built:
+            self.disconnect(self._expand_handler)
+            self._build_child_rows()
 
     def _build_child_rows(self) -> None:
+        self._built = True
         for item in self.items_data:
             if not isinstance(item, dict): continue
             row = self._build_single_row(item)
@@ -1515,30 +2533,33 @@ class ExpanderRow(DynamicIconMixin, Adw.ExpanderRow):
         props = item.get("properties", {})
         if not isinstance(props, dict): props = {}
 
+        factory = _ROW_FACTORIES.get(item_type)
+        if factory is None:
+            log.warning("Unknown item type '%s' in expander, skipping", item_type)
+            return None
+        cls, action_key = factory
         try:
-            match item_type:
-                case "button": return ButtonRow(props, item.get("on_press"), self.context)
-                case "toggle": return ToggleRow(props, item.get("on_toggle"), self.context)
-                case "label": return LabelRow(props, item.get("value"), self.context)
-                case "slider": return SliderRow(props, item.get("on_change"), self.context)
-                case "selection": return SelectionRow(props, item.get("on_change"), self.context)
-                case "entry": return EntryRow(props, item.get("on_action"), self.context)
-                case "navigation": return NavigationRow(props, item.get("layout"), self.context)
-                case "expander": return ExpanderRow(props, item.get("items"), self.context)
-                case _:
-                    log.warning("Unknown item type '%s' in expander, skipping", item_type)
-                    return None
+            return cls(props, item.get(action_key), self.context)
         except Exception as e:
             log.error("Failed to build child row for type '%s': %s", item_type, e)
             return None
 
     def do_unroot(self) -> None:
-        self._perform_cleanup()
+        self._state.mark_destroyed()
         Adw.ExpanderRow.do_unroot(self)
 
-    def _perform_cleanup(self) -> None:
-        sources = self._state.mark_destroyed_and_get_sources()
-        _batch_source_remove(*sources)
+
+# Expander child type -> (row class, item key holding its action/value)
+_ROW_FACTORIES: Final[dict[str, tuple[type[Adw.PreferencesRow], str]]] = {
+    "button": (ButtonRow, "on_press"),
+    "toggle": (ToggleRow, "on_toggle"),
+    "label": (LabelRow, "value"),
+    "slider": (SliderRow, "on_change"),
+    "selection": (SelectionRow, "on_change"),
+    "entry": (EntryRow, "on_action"),
+    "navigation": (NavigationRow, "layout"),
+    "expander": (ExpanderRow, "items"),
+}
 
 
 # =============================================================================
@@ -1559,8 +2580,8 @@ class GridCardBase(Gtk.Button):
         self._state = WidgetState()
         self.properties = properties
         self.on_action: ActionConfig = on_action or {}
-        self.context: RowContext = context or {}
-        self.toast_overlay: Adw.ToastOverlay | None = self.context.get("toast_overlay")
+        self.context: RowContext = context if context is not None else _EMPTY_CONTEXT
+        self.toast_overlay: Adw.ToastOverlay | None = self.context.toast_overlay
         
         self.icon_widget: Gtk.Image | None = None
         self.title_label: Gtk.Label | None = None
@@ -1587,19 +2608,15 @@ class GridCardBase(Gtk.Button):
         self._current_card_style = style
 
     def do_unroot(self) -> None:
-        self._perform_cleanup()
+        self._state.mark_destroyed()
         Gtk.Button.do_unroot(self)
 
-    def _perform_cleanup(self) -> None:
-        sources = self._state.mark_destroyed_and_get_sources()
-        _batch_source_remove(*sources)
-
     def _build_content(self, icon: str, title: str) -> Gtk.Box:
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=2)
         box.set_valign(Gtk.Align.CENTER)
         box.set_halign(Gtk.Align.CENTER)
 
-        img = Gtk.Image.new_from_icon_name(icon)
+        img = Gtk.Image.new_from_gicon(_themed_icon(icon))
         img.set_pixel_size(ICON_PIXEL_SIZE)
         img.add_css_class("hero-icon")
         self.icon_widget = img
@@ -1625,14 +2642,15 @@ class GridCard(DynamicIconMixin, GridCardBase):
     ) -> None:
         super().__init__(properties, on_press, context)
 
-        icon_conf = properties.get("icon", DEFAULT_ICON)
+        icon_conf = _parse_icon_config(properties.get("icon", DEFAULT_ICON))
         box = self._build_content(
-            _resolve_static_icon_name(icon_conf),
+            icon_conf.name,
             str(properties.get("title", "Unnamed")),
         )
 
         # Build overlay hierarchy before attaching to prevent visual flashes
         self.badge_label: Gtk.Label | None = None
+        self._last_badge_text: str | None = None  # Badge starts hidden
         badge_path = properties.get("badge_file")
         
         if badge_path:
@@ -1652,9 +2670,11 @@ class GridCard(DynamicIconMixin, GridCardBase):
         else:
             self.set_child(box)
 
-        self.connect("clicked", self._on_clicked)
+        # Action resolved once; a card without a valid action gets no handler
+        if (compiled := _compile_action(self.on_action, "Command")) is not None:
+            self.connect("clicked", partial(self._dispatch_compiled, compiled))
 
-        if _is_dynamic_icon(icon_conf) and isinstance(icon_conf, dict):
+        if _is_dynamic_icon(icon_conf):
             self._start_icon_update_loop(icon_conf)
 
         # Dynamic Text and Style Polling
@@ -1670,42 +2690,27 @@ class GridCard(DynamicIconMixin, GridCardBase):
         # Fetch immediately to bypass the initial get_mapped() delay
         _submit_task_safe(self._fetch_dynamic_state_async, self._state)
         
-        with self._state.lock:
-            if not self._state.is_destroyed:
-                self._state.value.source_id = GLib.timeout_add_seconds(
-                    MONITOR_INTERVAL_SECONDS, self._dynamic_state_tick
-                )
+        self._start_mapped_timer(
+            self._state.value, MONITOR_INTERVAL_SECONDS, self._dynamic_state_tick
+        )
 
     def _dynamic_state_tick(self) -> bool:
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return GLib.SOURCE_REMOVE
-                
-        if not self.get_mapped():
-            return GLib.SOURCE_CONTINUE
-            
+        if self._state.is_destroyed:  # GIL-protected bool load
+            return GLib.SOURCE_REMOVE
         _submit_task_safe(self._fetch_dynamic_state_async, self._state)
         return GLib.SOURCE_CONTINUE
 
     def _fetch_dynamic_state_async(self) -> None:
         """Runs in the background thread pool."""
-        val: str | None = None
-        try:
-            if self.text_file:
-                path = _expand_path(self.text_file)
-                if path.exists():
-                    val = path.read_text(encoding="utf-8").strip()
-        except Exception as e: 
-            log.debug(f"Failed to read dynamic state file {self.text_file}: {e}")
-            
-        GLib.idle_add(self._apply_dynamic_state_ui, val)
+        # A missing or unreadable file reads as None, as before
+        val = _read_small_text(_expand_path(self.text_file)) if self.text_file else None
+        _schedule_ui(self._apply_dynamic_state_ui, val)
 
     def _apply_dynamic_state_ui(self, val: str | None) -> bool:
         """Runs on the GTK main thread."""
-        with self._state.lock:
-            if self._state.is_destroyed:
-                return GLib.SOURCE_REMOVE
-                
+        if self._state.is_destroyed:  # GIL-protected bool load
+            return GLib.SOURCE_REMOVE
+
         if val is not None:
             new_label = self.text_map.get(val, self.text_map.get("default", self.base_title))
             if self.title_label and self.title_label.get_label() != new_label: 
@@ -1717,34 +2722,70 @@ class GridCard(DynamicIconMixin, GridCardBase):
         return GLib.SOURCE_REMOVE
 
     def _start_badge_monitor(self, path_str: str) -> None:
-        self._check_badge_tick(path_str)
-        with self._state.lock:
-            if self._state.is_destroyed: return
-            self._state.misc.source_id = GLib.timeout_add_seconds(
-                DEFAULT_INTERVAL_SECONDS, self._check_badge_tick, path_str
-            )
+        # Use 'misc' slot: the badge file is re-read only when inotify says so
+        # Bound once; every tick / inotify event resubmits the same task
+        self._badge_task = partial(self._fetch_badge_async, path_str)
+        self._request_badge()
+        path = str(_expand_path(path_str))
+        if not path.startswith(_PSEUDO_FS_PREFIXES):
+            try:
+                monitor = Gio.File.new_for_path(path).monitor_file(Gio.FileMonitorFlags.NONE, None)
+            except GLib.Error as e:
+                log.debug("Badge monitor unavailable for %s: %s", path, e.message)
+            else:
+                monitor.connect("changed", self._on_badge_changed)
+                with self._state.lock:
+                    if self._state.is_destroyed:
+                        monitor.cancel()
+                    else:
+                        self._state.misc.watch = monitor
+                return
+        # Pseudo filesystems emit no events: keep a timer, but only while visible
+        self._start_mapped_timer(self._state.misc, DEFAULT_INTERVAL_SECONDS, self._check_badge_tick)
 
-    def _check_badge_tick(self, path_str: str) -> bool:
-        if not self.get_mapped(): return GLib.SOURCE_CONTINUE
-        with self._state.lock:
-            if self._state.is_destroyed: return GLib.SOURCE_REMOVE
-        _submit_task_safe(lambda: self._fetch_badge_async(path_str), self._state)
+    def _on_badge_changed(
+        self,
+        monitor: Gio.FileMonitor,
+        file: Gio.File,
+        other_file: Gio.File | None,
+        event_type: Gio.FileMonitorEvent,
+    ) -> None:
+        if event_type in (
+            Gio.FileMonitorEvent.CHANGES_DONE_HINT,
+            Gio.FileMonitorEvent.CREATED,
+            Gio.FileMonitorEvent.DELETED,
+        ):
+            self._request_badge()
+
+    def _check_badge_tick(self) -> bool:
+        if self._state.is_destroyed: return GLib.SOURCE_REMOVE
+        self._request_badge()
         return GLib.SOURCE_CONTINUE
 
+    def _request_badge(self) -> None:
+        _submit_task_safe(self._badge_task, self._state)
+
     def _fetch_badge_async(self, path_str: str) -> None:
         count_text: str | None = None
         try:
-            path = _expand_path(path_str)
-            if path.exists():
-                content = path.read_text(encoding="utf-8").strip()
-                if content.isdigit() and int(content) > 0:
-                    count_text = content
-        except Exception: pass
-        GLib.idle_add(self._update_badge_ui, count_text)
+            # A badge is a few ASCII digits: one bounded raw read, no stat or decode
+            fd = os.open(_expand_path(path_str), os.O_RDONLY | os.O_NONBLOCK | os.O_CLOEXEC)
+            try:
+                raw = os.read(fd, BADGE_READ_MAX_BYTES).strip()
+            finally:
+                os.close(fd)
+            if raw.isdigit() and int(raw) > 0:
+                count_text = raw.decode("ascii")
+        except (OSError, ValueError): pass
+        # Racy read of a main-thread field is fine: worst case one extra flush
+        if count_text != self._last_badge_text:
+            _schedule_ui(self._update_badge_ui, count_text)
 
     def _update_badge_ui(self, text: str | None) -> bool:
-        with self._state.lock:
-            if self._state.is_destroyed: return GLib.SOURCE_REMOVE
+        if self._state.is_destroyed:  # GIL-protected bool load
+            return GLib.SOURCE_REMOVE
+        if text == self._last_badge_text: return GLib.SOURCE_REMOVE
+        self._last_badge_text = text
         if self.badge_label:
             if text:
                 self.badge_label.set_label(text)
@@ -1753,16 +2794,14 @@ class GridCard(DynamicIconMixin, GridCardBase):
                 self.badge_label.set_visible(False)
         return GLib.SOURCE_REMOVE
 
-    def _on_clicked(self, _button: Gtk.Button) -> None:
-        if not isinstance(self.on_action, dict): return
-        match self.on_action.get("type"):
-            case "exec":
-                if cmd := self.on_action.get("command"):
-                    success = utility.execute_command(str(cmd).strip(), "Command", bool(self.on_action.get("terminal", False)))
-                    utility.toast(self.toast_overlay, "▶ Launched" if success else "✖ Failed")
-            case "redirect":
-                if pid := self.on_action.get("page"):
-                    _perform_redirect(str(pid), self.context.get("config") or {}, self.context.get("sidebar"))
+    def _dispatch_compiled(self, compiled: _CompiledAction, _button: Gtk.Button) -> None:
+        if compiled[0] == "exec":
+            _, cmd, term, title = compiled
+            success = utility.execute_command(cmd, title, term)
+            utility.toast(self.toast_overlay, "▶ Launched" if success else "✖ Failed")
+        else:
+            _perform_redirect(compiled[1], self.context.config, self.context.sidebar)
+
 class GridToggleCard(DynamicIconMixin, StateMonitorMixin, GridCardBase):
     __gtype_name__ = "DuskyGridToggleCard"
 
@@ -1776,9 +2815,9 @@ class GridToggleCard(DynamicIconMixin, StateMonitorMixin, GridCardBase):
 
         self.is_active = False
 
-        icon_conf = properties.get("icon", DEFAULT_ICON)
+        icon_conf = _parse_icon_config(properties.get("icon", DEFAULT_ICON))
         box = self._build_content(
-            _resolve_static_icon_name(icon_conf),
+            icon_conf.name,
             str(properties.get("title", "Toggle")),
         )
 
@@ -1786,25 +2825,31 @@ class GridToggleCard(DynamicIconMixin, StateMonitorMixin, GridCardBase):
         box.append(self.status_lbl)
         self.set_child(box)
 
-        if key := properties.get("key"):
-            val = utility.load_setting(str(key).strip(), default=False)
+        # Click-path config resolved once
+        self._enabled_cmd = _compile_toggle_command(self.on_action, "enabled")
+        self._disabled_cmd = _compile_toggle_command(self.on_action, "disabled")
+        self._settings_key = _settings_key(properties)
+
+        if self._settings_key:
+            val = utility.load_setting(self._settings_key, default=False)
             if isinstance(val, bool):
                 self._set_visual(val)
 
         self.connect("clicked", self._on_clicked)
         self._start_state_monitor()
 
-        if _is_dynamic_icon(icon_conf) and isinstance(icon_conf, dict):
+        if _is_dynamic_icon(icon_conf):
             self._start_icon_update_loop(icon_conf)
 
     def _apply_state_update(self, new_state: bool) -> bool:
-        with self._state.lock:
-            if self._state.is_destroyed: return GLib.SOURCE_REMOVE
-        if new_state != self.is_active:
-            self._set_visual(new_state)
+        if self._state.is_destroyed:  # GIL-protected bool load
+            return GLib.SOURCE_REMOVE
+        self._set_visual(new_state)
         return GLib.SOURCE_REMOVE
 
     def _set_visual(self, state: bool) -> None:
+        # Label and class already match: skip the relayout/restyle
+        if state == self.is_active: return
         self.is_active = state
         self.status_lbl.set_label(STATE_ON if state else STATE_OFF)
         if state: self.add_css_class("toggle-active")
@@ -1813,15 +2858,11 @@ class GridToggleCard(DynamicIconMixin, StateMonitorMixin, GridCardBase):
     def _on_clicked(self, _button: Gtk.Button) -> None:
         new_state = not self.is_active
         self._set_visual(new_state)
-        if isinstance(self.on_action, dict):
-            action_key = "enabled" if new_state else "disabled"
-            if act := self.on_action.get(action_key):
-                if isinstance(act, dict) and (cmd := act.get("command")):
-                    utility.execute_command(str(cmd).strip(), "Toggle", bool(act.get("terminal", False)))
-        
+        if act := (self._enabled_cmd if new_state else self._disabled_cmd):
+            utility.execute_command(act[0], "Toggle", act[1])
+
         # Offload file I/O to thread pool
-        if key := self.properties.get("key"):
-            key_str = str(key).strip()
-            _submit_task_safe(lambda: utility.save_setting(key_str, new_state), self._state)
+        if key_str := self._settings_key:
+            _submit_task_safe(partial(utility.save_setting, key_str, new_state), self._state)
             
         return False
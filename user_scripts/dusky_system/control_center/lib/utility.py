@@ -15,6 +15,7 @@ import subprocess
 import sys
 import tempfile
 import threading
+import weakref
 from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Final, TypeVar, overload
@@ -36,6 +37,7 @@ __all__ = [
     "preflight_check",
     "save_setting",
     "toast",
+    "watch_setting",
 ]
 
 log: logging.Logger = logging.getLogger(__name__)
@@ -48,6 +50,10 @@ _T = TypeVar("_T")
 LABEL_NA: Final[str] = "N/A"
 _SHELL_METACHARACTERS: Final[frozenset[str]] = frozenset("|&;()<>$`\\\"'*?[]#~=!{}%")
 _TILDE_PATTERN: Final[re.Pattern[str]] = re.compile(r"(?:^|(?<=\s))~(?=/|$|\s)")
+_BOOL_TRUE: Final[frozenset[str]] = frozenset({"true", "yes", "on", "1"})
+_BOOL_TRUE_ALLCASE: Final[frozenset[str]] = frozenset(
+    v for s in _BOOL_TRUE for v in (s, s.upper(), s.capitalize())
+)
 
 
 def _get_xdg_path(env_var: str, default_suffix: str) -> Path:
@@ -155,7 +161,111 @@ class _ComputeOnceCache:
         return value
 
 
+class _SettingsFileCache:
+    """
+    Raw settings-file text keyed by setting key, kept coherent by one
+    Gio.FileMonitor per file. Any event on the file drops its entry and
+    bumps a generation counter, so a read that raced a change is never
+    stored. Without gi the cache stays empty and every load hits disk.
+    The same monitor fans events out to watch_setting() listeners.
+    """
+
+    __slots__ = ("_generations", "_listeners", "_lock", "_monitors", "_values")
+
+    def __init__(self) -> None:
+        self._lock: Final[threading.Lock] = threading.Lock()
+        self._values: dict[str, str | None] = {}  # None: file does not exist
+        self._generations: dict[str, int] = {}
+        self._monitors: dict[str, object] = {}
+        self._listeners: dict[str, list[weakref.WeakMethod]] = {}
+
+    def lookup(self, key: str) -> str | None | object:
+        """Cached raw text, or _UNCACHED. Lock-free: a dict read is atomic."""
+        return self._values.get(key, _UNCACHED)
+
+    def prepare(self, key: str, target: Path) -> int | None:
+        """Ensure *target* is watched; returns the generation to store against."""
+        with self._lock:
+            if key in self._monitors:
+                return self._generations.get(key, 0)
+
+        try:
+            from gi.repository import Gio, GLib
+        except ImportError:
+            return None
+        try:
+            monitor = Gio.File.new_for_path(str(target)).monitor_file(
+                Gio.FileMonitorFlags.NONE, None
+            )
+        except GLib.Error as e:
+            log.debug("Settings watch unavailable for %s: %s", key, e.message)
+            return None
+
+        with self._lock:
+            if key in self._monitors:
+                # Lost a race with another thread; keep its monitor
+                monitor.cancel()
+            else:
+                monitor.connect("changed", self._on_changed, key)
+                self._monitors[key] = monitor
+            return self._generations.get(key, 0)
+
+    def store(self, key: str, raw: str | None, generation: int) -> None:
+        with self._lock:
+            if self._generations.get(key, 0) == generation:
+                self._values[key] = raw
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def listen(self, key: str, target: Path, callback: Callable[..., None]) -> _SettingWatch | None:
+        if self.prepare(key, target) is None:
+            return None
+        ref = weakref.WeakMethod(callback)
+        with self._lock:
+            self._listeners.setdefault(key, []).append(ref)
+        return _SettingWatch(self, key, ref)
+
+    def unlisten(self, key: str, ref: weakref.WeakMethod) -> None:
+        with self._lock:
+            if ref in self._listeners.get(key, ()):
+                self._listeners[key].remove(ref)
+
+    def _on_changed(
+        self, monitor: object, file: object, other: object, event: object, key: str
+    ) -> None:
+        # Invalidate first: listeners that re-load the key see the new value
+        self.invalidate(key)
+        with self._lock:
+            refs = self._listeners.get(key)
+            if not refs:
+                return
+            alive = [r for r in refs if r() is not None]
+            self._listeners[key] = alive
+        for ref in alive:
+            if (callback := ref()) is not None:
+                callback(monitor, file, other, event)
+
+
+class _SettingWatch:
+    """Handle returned by watch_setting(); cancel() stops delivery."""
+
+    __slots__ = ("_cache", "_key", "_ref")
+
+    def __init__(self, cache: _SettingsFileCache, key: str, ref: weakref.WeakMethod) -> None:
+        self._cache = cache
+        self._key = key
+        self._ref = ref
+
+    def cancel(self) -> None:
+        self._cache.unlisten(self._key, self._ref)
+
+
+_UNCACHED: Final = object()
 _settings_dir_cache: Final = _ResolvedDirectoryCache(SETTINGS_DIR)
+_settings_file_cache: Final = _SettingsFileCache()
 _cache_dir_cache: Final = _ResolvedDirectoryCache(CACHE_DIR)
 _system_info_cache: Final = _ComputeOnceCache()
 
@@ -365,8 +475,14 @@ def _get_memory_total() -> str:
 
 
 def _get_memory_used() -> str:
+    # Polled by labels: MemTotal/MemAvailable sit in the first few lines, so
+    # one short raw read replaces decoding all of /proc/meminfo every tick
     try:
-        content = Path("/proc/meminfo").read_text(encoding="utf-8")
+        fd = os.open("/proc/meminfo", os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            content = os.read(fd, 512).decode("ascii", "replace")
+        finally:
+            os.close(fd)
         mem_total = 0
         mem_available = 0
         for line in content.splitlines():
@@ -448,6 +564,19 @@ def _validate_settings_path(key: str) -> Path | None:
         return None
 
 
+def watch_setting(key: str, callback: Callable[..., None]) -> _SettingWatch | None:
+    """
+    Call *callback* (a bound method, held weakly) with the Gio.FileMonitor
+    "changed" arguments whenever *key*'s file changes. Listeners share the
+    settings cache's monitor, so each file is watched once per process.
+    Returns a handle whose cancel() stops delivery, or None without gi.
+    """
+    target = _validate_settings_path(key)
+    if target is None:
+        return None
+    return _settings_file_cache.listen(key, target, callback)
+
+
 def save_setting(key: str, value: bool | int | float | str) -> bool:
     """Atomic write to disk (Temp File -> Fsync -> Rename)."""
     target = _validate_settings_path(key)
@@ -475,6 +604,8 @@ def save_setting(key: str, value: bool | int | float | str) -> bool:
 
         temp_path.rename(target)
         temp_path = None  # Prevent deletion of success file
+        # Don't wait for the monitor: a load right after the save must see it
+        _settings_file_cache.invalidate(key)
 
         # Sync parent directory
         dir_fd = os.open(target.parent, os.O_RDONLY | os.O_DIRECTORY)
@@ -512,13 +643,24 @@ def load_setting(
     default: bool | int | float | str | None = None,
 ) -> bool | int | float | str | None:
     """Load setting with automatic type coercion based on default value."""
-    target = _validate_settings_path(key)
-    if target is None:
-        return default
-
-    try:
-        raw = target.read_text(encoding="utf-8").strip()
-    except (FileNotFoundError, OSError):
+    raw = _settings_file_cache.lookup(key)
+    if raw is _UNCACHED:
+        target = _validate_settings_path(key)
+        if target is None:
+            return default
+
+        # Watch before reading, so a change during the read is not missed
+        generation = _settings_file_cache.prepare(key, target)
+        try:
+            raw = target.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            raw = None
+        except OSError:
+            return default
+        if generation is not None:
+            _settings_file_cache.store(key, raw, generation)
+
+    if raw is None:
         return default
 
     try:
@@ -533,8 +675,11 @@ def load_setting(
 
 def _parse_bool(value: str) -> bool:
     """Robust boolean parsing."""
-    lowered = value.lower().strip()
-    return lowered in {"true", "yes", "on", "1"}
+    # save_setting() writes "True"/"False", so the exact-match set
+    # answers almost every read without allocating a lowered copy
+    if value in _BOOL_TRUE_ALLCASE:
+        return True
+    return value.strip().lower() in _BOOL_TRUE
 
 
 # =============================================================================
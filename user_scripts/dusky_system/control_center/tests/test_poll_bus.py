@@ -0,0 +1,60 @@
+"""Regression tests for the shared poll bus in lib.rows (needs PyGObject)."""
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+try:
+    import gi  # noqa: F401
+except ImportError:
+    gi = None
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def tick(self) -> bool:
+        self.calls += 1
+        return True
+
+
+class _Broken:
+    def tick(self) -> bool:
+        raise RuntimeError("boom")
+
+
+@unittest.skipIf(gi is None, "PyGObject is not installed")
+class PollBusTests(unittest.TestCase):
+    def setUp(self) -> None:
+        from lib import rows
+
+        self.rows = rows
+        self.bus = rows._PollBus()
+
+    def tearDown(self) -> None:
+        if self.bus._source_id:
+            self.rows.GLib.source_remove(self.bus._source_id)
+
+    def test_raising_subscriber_does_not_stop_the_others(self) -> None:
+        first, second, broken = _Counter(), _Counter(), _Broken()
+        self.bus.subscribe(1, first.tick)
+        broken_token = self.bus.subscribe(1, broken.tick)
+        self.bus.subscribe(1, second.tick)
+
+        with self.assertLogs(self.rows.log, level="ERROR"):
+            self.assertTrue(self.bus._dispatch())
+        for _ in range(2):
+            self.assertTrue(self.bus._dispatch())
+
+        self.assertEqual(first.calls, 3)
+        self.assertEqual(second.calls, 3)
+        self.assertNotIn(broken_token, self.bus._subs)
+        self.assertNotEqual(self.bus._source_id, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()